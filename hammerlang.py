@@ -10,14 +10,25 @@ HammerLang v1.0 – Production Locked Validator (Security Hardened)
 """
 
 import argparse
+import concurrent.futures
+import contextlib
+import functools
 import hashlib
+import io
 import json
 import os
 import re
 import sys
+import time
 import unicodedata
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Callable, Dict, Iterator, List, Optional, TextIO, Tuple, Union
+
+try:
+    import fcntl  # POSIX: lock del journal entre aprobadores concurrentes
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
 
 # ---------------------------------------------------------------------
 # CONFIGURACIÓN BÁSICA
@@ -29,9 +40,30 @@ ALLOWED_NAMESPACES = ["LLP", "BANK", "FSM", "DTL"]
 
 # Regex ENDURECIDOS con anclas de seguridad
 HEADER_RE = r'^#([A-Z]+):([A-Z0-9_]+):v\d+\.\d+'  # Ancla ^ al inicio, permite dígitos en SPEC
-CHECKSUM_RE_PATTERN = r'⊨[a-f0-9]{8}(?=\s*$)'  # Ancla de fin de línea - literal UTF-8
+HEADER_RE_COMPILED = re.compile(HEADER_RE, re.MULTILINE)
+NAMESPACE_RE = re.compile(r'^#([A-Z]+):', re.MULTILINE)
+# Ancla de fin de línea - literal UTF-8. El lookahead no cruza '\n' ([^\S\n] en vez de \s),
+# así un run de whitespace multilínea no se re-escanea por cada marcador.
+# Sellos: legacy ⊨xxxxxxxx (SHA-256 truncado a 32 bits) o versionado ⊨<alg>:<digest de 256 bits>.
+CHECKSUM_RE_PATTERN = r'⊨(?:[a-f0-9]{8}|(?:sha256|blake2b):[a-f0-9]{64})(?=[^\S\n]*$)'
 CHECKSUM_RE = re.compile(CHECKSUM_RE_PATTERN, re.UNICODE | re.MULTILINE)  # Pre-compilado para robustez
 
+# Algoritmos de sello. "legacy" solo se mantiene para validar/sellar specs existentes;
+# BLAKE2b es más rápido que SHA-256 en hosts sin SHA-NI y es el default para sellos nuevos.
+SEAL_ALGORITHMS: Dict[str, Callable[[bytes], str]] = {
+    "legacy": lambda data: hashlib.sha256(data).hexdigest()[:8],
+    "sha256": lambda data: hashlib.sha256(data).hexdigest(),
+    "blake2b": lambda data: hashlib.blake2b(data, digest_size=32).hexdigest(),
+}
+DEFAULT_SEAL_ALGORITHM = "blake2b"
+
+# Presupuestos por spec (input no confiable): tamaño máximo y tiempo de validación.
+# Todas las etapas son lineales, así que el tamaño acota el tiempo; el presupuesto
+# de tiempo es una segunda barrera que se chequea entre etapas.
+MAX_SPEC_BYTES = 1 << 20  # 1 MiB (también se aplica como límite de caracteres)
+SPEC_TIME_BUDGET = 2.0  # segundos
+SYMBOL_CHUNK_CHARS = 1 << 14  # granularidad de NFKC + chequeo de deadline en validate_symbols
+
 # Whitelist de caracteres permitidos (incluye newlines explícitos)
 ALLOWED_CHARS = set(
     "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_:# v."
@@ -48,19 +80,38 @@ DEFAULT_ALLOWED_CHECKSUMS: Dict[str, Union[str, dict]] = {
     "a8f3c9e2": "DORA ICT minimal spec – ICT:DORA",
 }
 
+# Allowlist: snapshot JSON + journal append-only de aprobaciones.
+# El journal se compacta en el snapshot al superar ALLOWLIST_JOURNAL_MAX_BYTES,
+# así el replay al cargar queda acotado sin importar cuántas aprobaciones haya.
+ALLOWLIST_PATH = Path("config/allowed_checksums.json")
+ALLOWLIST_JOURNAL_PATH = Path("config/allowed_checksums.journal.jsonl")
+ALLOWLIST_JOURNAL_MAX_BYTES = 256 * 1024
+
+# Reporting: formatos de salida y tamaño del buffer para modo batch
+REPORT_FORMATS = ["text", "jsonl"]
+REPORT_BUFFER_SIZE = 1 << 16
+
 
 # ---------------------------------------------------------------------
 # UTILIDADES
 # ---------------------------------------------------------------------
 
-def robust_checksum(spec: str) -> str:
-    """SHA-256 -> 8 hex chars deterministas."""
-    h = hashlib.sha256(spec.encode("utf-8")).hexdigest()
-    return h[:8]
+def robust_checksum(spec: str, algorithm: str = "legacy") -> str:
+    """
+    Checksum determinista del spec, tal como aparece después de ⊨.
+    legacy -> 8 hex chars (SHA-256 truncado); sha256/blake2b -> "<alg>:<64 hex>".
+    """
+    digest = SEAL_ALGORITHMS[algorithm](spec.encode("utf-8"))
+    return digest if algorithm == "legacy" else f"{algorithm}:{digest}"
+
+
+def seal_algorithm(checksum: str) -> str:
+    """Algoritmo de un checksum extraído: el tag antes de ':' o legacy si no tiene."""
+    return checksum.split(":", 1)[0] if ":" in checksum else "legacy"
 
 
 def extract_checksum(code: str) -> str:
-    """Extrae el checksum desde la línea con ⊨xxxx. Usa literal UTF-8."""
+    """Extrae el checksum (legacy o con tag de algoritmo) desde la línea con ⊨. Usa literal UTF-8."""
     m = CHECKSUM_RE.search(code)
     if not m:
         return ""
@@ -80,13 +131,14 @@ def strip_checksum_line(code: str) -> str:
     for line in lines:
         # Solo eliminar la línea si contiene el patrón de checksum completo
         # Usar CHECKSUM_RE directamente para 100% consistency
-        if not CHECKSUM_RE.search(line):
+        # (el test de '⊨' evita correr el regex en líneas sin marcador)
+        if "⊨" not in line or not CHECKSUM_RE.search(line):
             filtered_lines.append(line)
     
     return '\n'.join(filtered_lines)
 
 
-def load_allowed_checksums() -> Dict[str, Union[str, dict]]:
+def load_allowed_checksums(quiet: bool = False) -> Dict[str, Union[str, dict]]:
     """
     Carga allowed checksums en orden de prioridad (FAIL-SAFE MODE):
     1. Variable de entorno ALLOWED_CHECKSUMS (JSON string)
@@ -94,6 +146,7 @@ def load_allowed_checksums() -> Dict[str, Union[str, dict]]:
     3. DEFAULT_ALLOWED_CHECKSUMS (fallback)
     
     SECURITY: Cualquier error en archivos externos causa terminación fatal.
+    Con quiet=True se omiten los mensajes informativos (los FATAL se mantienen).
     """
     # Prioridad 1: Variable de entorno
     env_checksums = os.getenv("ALLOWED_CHECKSUMS")
@@ -101,7 +154,8 @@ def load_allowed_checksums() -> Dict[str, Union[str, dict]]:
         try:
             data = json.loads(env_checksums)
             if isinstance(data, dict):
-                print("ℹ️  Loaded checksums from environment variable")
+                if not quiet:
+                    print("ℹ️  Loaded checksums from environment variable")
                 return data
             else:
                 print("❌ FATAL: ALLOWED_CHECKSUMS env var is not a valid dict")
@@ -110,30 +164,136 @@ def load_allowed_checksums() -> Dict[str, Union[str, dict]]:
             print(f"❌ FATAL: Invalid JSON in ALLOWED_CHECKSUMS env var: {e}")
             sys.exit(1)
 
-    # Prioridad 2: Archivo externo (FAIL-SAFE)
-    external = Path("config/allowed_checksums.json")
-    if external.is_file():
+    # Prioridad 2: Archivo externo + journal de aprobaciones (FAIL-SAFE)
+    if ALLOWLIST_PATH.is_file() or ALLOWLIST_JOURNAL_PATH.is_file():
         try:
-            with external.open() as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    print("ℹ️  Loaded checksums from config/allowed_checksums.json")
-                    return data
-                else:
-                    print("❌ FATAL: config/allowed_checksums.json does not contain a valid dict")
-                    sys.exit(1)
-        except json.JSONDecodeError as e:
-            print(f"❌ FATAL: Invalid JSON in config/allowed_checksums.json: {e}")
+            data = read_allowlist(ALLOWLIST_PATH, ALLOWLIST_JOURNAL_PATH)
+        except ValueError as e:
+            # El mensaje nombra el archivo (y la línea del journal) que falló
+            print(f"❌ FATAL: Invalid allowlist: {e}")
             sys.exit(1)
         except Exception as e:
-            print(f"❌ FATAL: Error loading config/allowed_checksums.json: {e}")
+            print(f"❌ FATAL: Error loading {ALLOWLIST_PATH}: {e}")
             sys.exit(1)
+        if not quiet:
+            print(f"ℹ️  Loaded checksums from {ALLOWLIST_PATH}")
+        return data
 
     # Prioridad 3: Defaults
-    print("ℹ️  Using default hardcoded checksums")
+    if not quiet:
+        print("ℹ️  Using default hardcoded checksums")
     return DEFAULT_ALLOWED_CHECKSUMS
 
 
+@contextlib.contextmanager
+def journal_lock(journal: Path, exclusive: bool) -> Iterator[Optional[TextIO]]:
+    """
+    Abre el journal y toma un lock advisory sobre ese mismo descriptor
+    (sin lock donde no hay fcntl). Entrega el archivo abierto.
+
+    La existencia del journal se decide una sola vez, al abrir: en modo
+    compartido (lectura) nunca se crean archivos y, si no existe, se entrega None.
+    """
+    if exclusive:
+        journal.parent.mkdir(parents=True, exist_ok=True)
+        f = open(journal, "a+", encoding="utf-8")
+    else:
+        try:
+            f = open(journal, "r", encoding="utf-8")
+        except FileNotFoundError:
+            f = None
+    if f is None:
+        yield None
+        return
+    with f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield f
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _read_allowlist_locked(
+    snapshot: Path, journal: Path, journal_file: Optional[TextIO]
+) -> Dict[str, Union[str, dict]]:
+    """Snapshot + replay del journal ya abierto y bloqueado por journal_lock()."""
+    data: Dict[str, Union[str, dict]] = {}
+    if snapshot.is_file():
+        with snapshot.open(encoding="utf-8") as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{snapshot}: {e}") from e
+        if not isinstance(data, dict):
+            raise ValueError(f"{snapshot} does not contain a valid dict")
+    if journal_file is not None:
+        journal_file.seek(0)
+        for n, line in enumerate(journal_file, 1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{journal}:{n}: {e}") from e
+            if not isinstance(entry, dict) or "checksum" not in entry:
+                raise ValueError(f"{journal}:{n} is not a valid approval record")
+            checksum = entry.pop("checksum")
+            data[checksum] = entry
+    return data
+
+
+def read_allowlist(snapshot: Path, journal: Path) -> Dict[str, Union[str, dict]]:
+    """
+    Carga el snapshot JSON y re-aplica el journal encima (la última aprobación gana).
+    El replay es idempotente: un crash entre compactación y truncado no corrompe nada.
+    """
+    with journal_lock(journal, exclusive=False) as f:
+        return _read_allowlist_locked(snapshot, journal, f)
+
+
+def compact_allowlist(snapshot: Path, journal: Path) -> int:
+    """
+    Compacta journal -> snapshot bajo lock exclusivo.
+    Escribe el snapshot de forma atómica (tmp + os.replace) y trunca el journal.
+    Devuelve la cantidad de entradas del snapshot resultante.
+    """
+    with journal_lock(journal, exclusive=True) as f:
+        data = _read_allowlist_locked(snapshot, journal, f)
+        tmp = snapshot.with_name(snapshot.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as out:
+            json.dump(data, out, indent=2, ensure_ascii=False)
+            out.write("\n")
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp, snapshot)
+        f.truncate(0)
+        f.flush()
+        os.fsync(f.fileno())
+    return len(data)
+
+
+def append_approvals(entries: List[dict], snapshot: Path, journal: Path) -> bool:
+    """
+    Agrega aprobaciones al journal con un único write() en modo append.
+    Compacta si el journal supera ALLOWLIST_JOURNAL_MAX_BYTES.
+    Devuelve True si hubo compactación.
+    """
+    payload = "".join(
+        json.dumps(e, ensure_ascii=False, separators=(",", ":")) + "\n" for e in entries
+    )
+    with journal_lock(journal, exclusive=True) as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+        size = os.fstat(f.fileno()).st_size
+    if size > ALLOWLIST_JOURNAL_MAX_BYTES:
+        compact_allowlist(snapshot, journal)
+        return True
+    return False
+
+
 def parse_checksum_entry(entry: Union[str, dict]) -> dict:
     """
     Normaliza entrada de checksum a formato con metadatos.
@@ -158,41 +318,78 @@ def parse_checksum_entry(entry: Union[str, dict]) -> dict:
 # VALIDACIONES
 # ---------------------------------------------------------------------
 
-def validate_symbols(code: str) -> List[str]:
+def _symbol_chunk_end(code: str, start: int) -> int:
+    """Fin del próximo chunk: corta en '\n' o, si no hay, antes de una marca combinante."""
+    end = start + SYMBOL_CHUNK_CHARS
+    if end >= len(code):
+        return len(code)
+    nl = code.rfind("\n", start, end)
+    if nl >= start:
+        return nl + 1
+    # Línea gigante: no partir una secuencia base + combinantes (NFKC la recompone)
+    while end > start + 1 and unicodedata.combining(code[end]):
+        end -= 1
+    return end
+
+
+def validate_symbols(code: str, deadline: Optional[float] = None) -> List[str]:
     """
     Validación de símbolos con defensa contra homógrafos Unicode.
-    Normaliza a NFKC antes de validar.
+    Normaliza a NFKC antes de validar, por chunks: corta en el primer
+    símbolo no permitido y revisa el deadline entre chunks.
     """
     issues: List[str] = []
     
-    # DEFENSA CONTRA HOMÓGRAFOS: Normalización Unicode
-    normalized_code = unicodedata.normalize('NFKC', code)
-    
-    for ch in normalized_code:
-        if ch not in ALLOWED_CHARS:
-            issues.append(f"❌ Unknown symbol: {repr(ch)} (Unicode normalized)")
+    start = 0
+    while start < len(code):
+        if deadline is not None and time.perf_counter() > deadline:
+            issues.append(f"❌ Validation exceeded time budget ({SPEC_TIME_BUDGET}s)")
             break
+        end = _symbol_chunk_end(code, start)
+        chunk = code[start:end]
+        start = end
+
+        # DEFENSA CONTRA HOMÓGRAFOS: Normalización Unicode
+        # (NFKC es la identidad sobre ASCII: se evita la copia normalizada)
+        normalized = chunk if chunk.isascii() else unicodedata.normalize('NFKC', chunk)
+        if set(normalized) <= ALLOWED_CHARS:
+            continue
+        for ch in normalized:
+            if ch not in ALLOWED_CHARS:
+                issues.append(f"❌ Unknown symbol: {repr(ch)} (Unicode normalized)")
+                break
+        break
     
     return issues
 
 
+def budget_issues(code: str) -> List[str]:
+    """Rechaza specs que exceden MAX_SPEC_BYTES antes de correr cualquier regex."""
+    if len(code) > MAX_SPEC_BYTES:
+        return [f"❌ Spec exceeds size budget ({len(code)} chars > {MAX_SPEC_BYTES})"]
+    return []
+
+
 def validate_syntax(code: str) -> List[str]:
-    """Validación sintáctica básica de HammerLang."""
-    issues: List[str] = []
+    """Validación sintáctica básica de HammerLang (con presupuesto de tamaño y tiempo)."""
+    issues = budget_issues(code)
+    if issues:
+        return issues
+    deadline = time.perf_counter() + SPEC_TIME_BUDGET
 
     # Validar header con ancla de inicio
-    if not re.search(HEADER_RE, code, re.MULTILINE):
+    if not HEADER_RE_COMPILED.search(code):
         issues.append("❌ No namespace header (#NAMESPACE:SPEC:vX.Y) at file start")
 
     # Validar checksum con ancla de fin de línea (pre-compilado, ya tiene flags)
     if not CHECKSUM_RE.search(code):
-        issues.append("❌ Invalid checksum format (expected ⊨[a-f0-9]{8} at line end)")
+        issues.append("❌ Invalid checksum format (expected ⊨[a-f0-9]{8} or ⊨<sha256|blake2b>:[a-f0-9]{64} at line end)")
 
     if code.count('[') != code.count(']'):
         issues.append("❌ Unbalanced brackets []")
 
     # EXTRAER NAMESPACE CORRECTAMENTE
-    namespace_match = re.search(r'^#([A-Z]+):', code, re.MULTILINE)
+    namespace_match = NAMESPACE_RE.search(code)
     if namespace_match:
         namespace = namespace_match.group(1)
         if namespace not in ALLOWED_NAMESPACES:
@@ -200,27 +397,42 @@ def validate_syntax(code: str) -> List[str]:
     else:
         issues.append("❌ Could not extract namespace")
 
-    # Whitelist de símbolos (con defensa homógrafo)
-    issues.extend(validate_symbols(code))
+    # Whitelist de símbolos (con defensa homógrafo); el deadline se revisa entre chunks
+    issues.extend(validate_symbols(code, deadline))
 
     return issues
 
 
-def validate_checksum(code: str) -> bool:
-    """Revalida el checksum embebido."""
+def checksum_issues(code: str) -> List[str]:
+    """Revalida el checksum embebido sin imprimir; devuelve la lista de problemas."""
+    issues = budget_issues(code)
+    if issues:
+        return issues
+    deadline = time.perf_counter() + SPEC_TIME_BUDGET
+
     embedded = extract_checksum(code)
     if not embedded:
-        print("❌ No checksum marker ⊨XXXXXXXX found")
-        return False
+        return ["❌ No checksum marker ⊨XXXXXXXX found"]
 
     base = strip_checksum_line(code)
-    recomputed = robust_checksum(base)
+    if time.perf_counter() > deadline:
+        return [f"❌ Validation exceeded time budget ({SPEC_TIME_BUDGET}s)"]
+    recomputed = robust_checksum(base, seal_algorithm(embedded))
 
     if embedded != recomputed:
-        print(f"❌ Checksum mismatch: embedded={embedded}, recomputed={recomputed}")
+        return [f"❌ Checksum mismatch: embedded={embedded}, recomputed={recomputed}"]
+    return []
+
+
+def validate_checksum(code: str) -> bool:
+    """Revalida el checksum embebido."""
+    issues = checksum_issues(code)
+    if issues:
+        for i in issues:
+            print(i)
         return False
 
-    print(f"✅ Checksum OK: {embedded}")
+    print(f"✅ Checksum OK: {extract_checksum(code)}")
     return True
 
 
@@ -228,65 +440,254 @@ def validate_checksum(code: str) -> bool:
 # MODO BLOQUEADO (PROD)
 # ---------------------------------------------------------------------
 
-def validate_locked(path: str) -> bool:
-    """Production Locked Mode: syntax + checksum + whitelist de checksums."""
-    if not IMMUTABLE_RULESET:
-        print("⚠️ IMMUTABLE_RULESET is False, locked mode disabled")
-        return False
+def check_spec(path: str, allowed: Optional[Dict[str, Union[str, dict]]] = None) -> dict:
+    """
+    Valida un spec sin imprimir y devuelve un registro con el resultado.
 
-    p = Path(path)
-    if not p.is_file():
-        print(f"❌ Spec file not found: {path}")
-        return False
+    Etapas: file -> syntax -> checksum -> allowlist. Si `allowed` es None se
+    omite la etapa de allowlist (modo `validate`). El registro contiene:
+    path, verdict (PASS/FAIL), checksum, stage (etapa que falló o None),
+    issues, audit (metadatos de aprobación o None) y duration_ms.
+    """
+    return check_spec_code(path, allowed)[0]
 
-    code = p.read_text(encoding="utf-8")
 
-    print("=" * 70)
-    print("HAMMERLANG PRODUCTION LOCKED MODE (SECURITY HARDENED)")
-    print("=" * 70)
-    print(f"Validating: {path}\n")
+def check_spec_code(
+    path: str, allowed: Optional[Dict[str, Union[str, dict]]] = None
+) -> Tuple[dict, Optional[str]]:
+    """
+    Como check_spec(), pero devuelve también el texto exacto que se validó
+    (None si el archivo no se pudo leer). El archivo se lee una sola vez:
+    quien publique el spec debe usar ese texto, no releer el archivo.
+    """
+    started = time.perf_counter()
+    record = {
+        "path": path,
+        "verdict": "FAIL",
+        "checksum": None,
+        "stage": None,
+        "issues": [],
+        "audit": None,
+        "duration_ms": 0.0,
+    }
+
+    code: Optional[str] = None
+
+    def finish(stage: Optional[str], issues: List[str]) -> Tuple[dict, Optional[str]]:
+        record["stage"] = stage
+        record["issues"] = issues
+        record["verdict"] = "FAIL" if stage else "PASS"
+        record["duration_ms"] = round((time.perf_counter() - started) * 1000, 3)
+        return record, code
+
+    p = Path(path)
+    if not p.is_file():
+        return finish("file", [f"❌ Spec file not found: {path}"])
+    try:
+        size = p.stat().st_size
+        if size > MAX_SPEC_BYTES:
+            return finish("file", [f"❌ Spec exceeds size budget ({size} bytes > {MAX_SPEC_BYTES})"])
+        code = p.read_text(encoding="utf-8")
+    except UnicodeDecodeError as e:
+        return finish("file", [f"❌ Spec is not valid UTF-8: {e}"])
+    except OSError as e:
+        return finish("file", [f"❌ Cannot read spec: {e}"])
 
-    print("Step 1: Syntax validation...")
     issues = validate_syntax(code)
     if issues:
-        for i in issues:
-            print(i)
-        print("❌ Syntax validation FAILED")
-        return False
-    print("✅ Syntax validation PASSED\n")
+        return finish("syntax", issues)
 
-    print("Step 2: Checksum validation...")
-    m = CHECKSUM_RE.search(code)
-    if not m:
-        print("❌ No valid checksum found")
-        return False
+    record["checksum"] = extract_checksum(code)
+    issues = checksum_issues(code)
+    if issues:
+        return finish("checksum", issues)
+
+    if allowed is not None:
+        if record["checksum"] not in allowed:
+            return finish("allowlist", ["❌ Checksum not allowed in Production Locked Mode"])
+        record["audit"] = parse_checksum_entry(allowed[record["checksum"]])
+
+    return finish(None, [])
+
+
+def render_banner(record: dict, out: TextIO) -> None:
+    """Renderer legible (banner decorado) para un registro de Production Locked Mode."""
+    if record["stage"] == "file":
+        out.write(f"{record['issues'][0]}\n")
+        return
+
+    bar = "=" * 70
+    out.write(f"{bar}\nHAMMERLANG PRODUCTION LOCKED MODE (SECURITY HARDENED)\n{bar}\n")
+    out.write(f"Validating: {record['path']}\n\n")
+
+    out.write("Step 1: Syntax validation...\n")
+    if record["stage"] == "syntax":
+        for i in record["issues"]:
+            out.write(f"{i}\n")
+        out.write("❌ Syntax validation FAILED\n")
+        return
+    out.write("✅ Syntax validation PASSED\n\n")
+
+    out.write("Step 2: Checksum validation...\n")
+    if not record["checksum"]:
+        out.write("❌ No valid checksum found\n")
+        return
+    out.write(f"Found checksum: {record['checksum']}\n")
+    if record["stage"] == "checksum":
+        for i in record["issues"]:
+            out.write(f"{i}\n")
+        out.write("❌ Checksum self-validation FAILED\n")
+        return
+    out.write(f"✅ Checksum OK: {record['checksum']}\n")
+
+    if record["stage"] == "allowlist":
+        out.write(f"{record['issues'][0]}\n")
+        return
+
+    audit = record["audit"]
+    out.write(f"✅ Checksum APPROVED: {audit['spec']}\n")
+    out.write("   📝 Audit Trail:\n")
+    out.write(f"      • Signed by: {audit['signed_by']}\n")
+    out.write(f"      • Timestamp: {audit['timestamp']}\n\n")
+    out.write(f"{bar}\n✅ VALIDATION PASSED - SPEC IS PRODUCTION-LOCKED\n{bar}\n")
+
+
+def render_text(record: dict, out: TextIO) -> None:
+    """Renderer legible para el modo `validate` (sin allowlist, sin banner)."""
+    if record["stage"]:
+        for i in record["issues"]:
+            out.write(f"{i}\n")
+        return
+    out.write(f"✅ Checksum OK: {record['checksum']}\n")
+    out.write("✅ Spec is syntactically valid and checksum matches\n")
+
+
+def render_quiet(record: dict, out: TextIO) -> None:
+    """Renderer compacto: una línea por spec."""
+    line = f"{record['verdict']} {record['path']} {record['checksum'] or '-'}"
+    if record["stage"]:
+        line += f" [{record['stage']}] {record['issues'][0]}"
+    out.write(line + "\n")
+
+
+def render_jsonl(record: dict, out: TextIO) -> None:
+    """Renderer JSON-lines: un registro compacto por spec."""
+    out.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+
+@contextlib.contextmanager
+def report_writer(stream: Optional[TextIO] = None) -> Iterator[TextIO]:
+    """
+    Writer con buffer grande sobre stdout para reportes batch.
+    Evita un write() sin buffer por línea; se vacía una sola vez al final.
+    """
+    stream = stream or sys.stdout
+    stream.flush()
+    raw = getattr(stream, "buffer", None)
+    if raw is None:
+        # stdout reemplazado (p.ej. StringIO en tests): escribir en memoria y volcar al final
+        buf = io.StringIO()
+        yield buf
+        stream.write(buf.getvalue())
+        stream.flush()
+        return
+    writer = io.TextIOWrapper(
+        io.BufferedWriter(raw, buffer_size=REPORT_BUFFER_SIZE),
+        encoding="utf-8",
+        newline="\n",
+    )
+    try:
+        yield writer
+    finally:
+        writer.flush()
+        writer.detach().detach()
 
-    # Usar literal UTF-8 para replace (consistency)
-    checksum = m.group(0).replace("⊨", "")
-    print(f"Found checksum: {checksum}")
 
-    if not validate_checksum(code):
-        print("❌ Checksum self-validation FAILED")
+def validate_locked(path: str) -> bool:
+    """Production Locked Mode: syntax + checksum + whitelist de checksums."""
+    if not IMMUTABLE_RULESET:
+        print("⚠️ IMMUTABLE_RULESET is False, locked mode disabled")
         return False
 
-    allowed = load_allowed_checksums()
-    print(f"ℹ️  Loaded {len(allowed)} approved checksums")
+    record = check_spec(path, load_allowed_checksums())
+    render_banner(record, sys.stdout)
+    return record["verdict"] == "PASS"
 
-    if checksum not in allowed:
-        print("❌ Checksum not allowed in Production Locked Mode")
-        return False
 
-    # Parsear entrada con metadatos y VALIDAR AUDITORÍA
-    entry = parse_checksum_entry(allowed[checksum])
-    print(f"✅ Checksum APPROVED: {entry['spec']}")
-    print(f"   📝 Audit Trail:")
-    print(f"      • Signed by: {entry['signed_by']}")
-    print(f"      • Timestamp: {entry['timestamp']}\n")
+# ---------------------------------------------------------------------
+# SEAL / APPROVE
+# ---------------------------------------------------------------------
 
-    print("=" * 70)
-    print("✅ VALIDATION PASSED - SPEC IS PRODUCTION-LOCKED")
-    print("=" * 70)
-    return True
+def seal_code(code: str, algorithm: str = DEFAULT_SEAL_ALGORITHM) -> str:
+    """Reemplaza (o agrega) la línea ⊨checksum al final del spec."""
+    body = strip_checksum_line(code).rstrip("\n") + "\n"
+    return f"{body}⊨{robust_checksum(body, algorithm)}\n"
+
+
+def seal_spec(path: str, write: bool = False, algorithm: str = DEFAULT_SEAL_ALGORITHM) -> dict:
+    """Calcula el sello de un spec; con write=True lo embebe en el archivo."""
+    p = Path(path)
+    if not p.is_file():
+        return {"path": path, "checksum": None, "written": False,
+                "issues": [f"❌ Spec file not found: {path}"]}
+    code = p.read_text(encoding="utf-8")
+    issues = budget_issues(code)
+    if issues:
+        return {"path": path, "checksum": None, "written": False, "issues": issues}
+    sealed = seal_code(code, algorithm)
+    written = write and sealed != code
+    if written:
+        p.write_text(sealed, encoding="utf-8")
+    return {"path": path, "checksum": extract_checksum(sealed), "written": written, "issues": []}
+
+
+def parallel_map(fn: Callable, items: List[str], jobs: Optional[int] = None) -> List:
+    """map() sobre un pool de procesos (serial si hay un solo item o jobs=1)."""
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    chunksize = max(1, len(items) // (jobs * 4))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(fn, items, chunksize=chunksize))
+
+
+def spec_title(path: str) -> str:
+    """Título por defecto para la allowlist: el header #NS:SPEC:vX.Y del spec."""
+    m = HEADER_RE_COMPILED.search(Path(path).read_text(encoding="utf-8"))
+    return m.group(0).lstrip("#") if m else Path(path).name
+
+
+def approve_specs(
+    paths: List[str],
+    signed_by: str,
+    title: Optional[str] = None,
+    jobs: Optional[int] = None,
+    snapshot: Optional[Path] = None,
+    journal: Optional[Path] = None,
+) -> List[dict]:
+    """
+    Valida (syntax + checksum) en paralelo y registra los specs válidos en el
+    journal de la allowlist. Devuelve un registro de check_spec() por spec.
+    """
+    snapshot = snapshot or ALLOWLIST_PATH
+    journal = journal or ALLOWLIST_JOURNAL_PATH
+    records = parallel_map(check_spec, paths, jobs)
+    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    entries = []
+    for record in records:
+        if record["verdict"] != "PASS":
+            continue
+        record["audit"] = {
+            "spec": title or spec_title(record["path"]),
+            "signed_by": signed_by,
+            "timestamp": timestamp,
+        }
+        entries.append({"checksum": record["checksum"], **record["audit"]})
+
+    if entries:
+        append_approvals(entries, snapshot, journal)
+    return records
 
 
 # ---------------------------------------------------------------------
@@ -295,28 +696,74 @@ def validate_locked(path: str) -> bool:
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="HammerLang validator (Security Hardened)")
-    parser.add_argument("mode", choices=["validate", "validate_locked"], help="Validation mode")
-    parser.add_argument("spec", help="Path to HammerLang spec")
+    parser.add_argument("mode", choices=["validate", "validate_locked", "seal", "approve"],
+                        help="Validation mode, or seal/approve specs")
+    parser.add_argument("spec", nargs="+", help="Path(s) to HammerLang spec(s)")
+    parser.add_argument("--format", choices=REPORT_FORMATS, default="text",
+                        help="Output format: human-readable text or one JSON record per spec")
+    parser.add_argument("--quiet", action="store_true",
+                        help="Emit one compact line per spec instead of the banner")
+    parser.add_argument("--write", action="store_true",
+                        help="seal: embed the computed ⊨checksum line into each spec")
+    parser.add_argument("--algorithm", choices=list(SEAL_ALGORITHMS), default=DEFAULT_SEAL_ALGORITHM,
+                        help="seal: digest for new seals (legacy = 8-hex truncated SHA-256)")
+    parser.add_argument("--signed-by", help="approve: approver recorded in the audit trail")
+    parser.add_argument("--title", help="approve: allowlist description (default: spec header)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="seal/approve: worker processes (default: CPU count)")
     args = parser.parse_args()
 
-    if args.mode == "validate_locked":
-        ok = validate_locked(args.spec)
+    compact = args.quiet or args.format == "jsonl"
+
+    if args.mode == "seal":
+        ok = True
+        with report_writer() if compact else contextlib.nullcontext(sys.stdout) as out:
+            for record in parallel_map(functools.partial(seal_spec, write=args.write,
+                                                         algorithm=args.algorithm),
+                                       args.spec, args.jobs):
+                if args.format == "jsonl":
+                    render_jsonl(record, out)
+                elif record["issues"]:
+                    out.write(f"{record['issues'][0]}\n")
+                else:
+                    note = " (written)" if record["written"] else ""
+                    out.write(f"⊨{record['checksum']} {record['path']}{note}\n")
+                ok = ok and not record["issues"]
         sys.exit(0 if ok else 1)
-    else:
-        p = Path(args.spec)
-        if not p.is_file():
-            print(f"❌ Spec file not found: {args.spec}")
-            sys.exit(1)
-        code = p.read_text(encoding="utf-8")
-        issues = validate_syntax(code)
-        if issues:
-            for i in issues:
-                print(i)
-            sys.exit(1)
-        if not validate_checksum(code):
+
+    if args.mode == "approve":
+        if not args.signed_by:
+            parser.error("approve requires --signed-by")
+        records = approve_specs(args.spec, args.signed_by, args.title, args.jobs)
+        renderer = render_jsonl if args.format == "jsonl" else render_quiet
+        with report_writer() if compact else contextlib.nullcontext(sys.stdout) as out:
+            for record in records:
+                renderer(record, out)
+        sys.exit(0 if all(r["verdict"] == "PASS" for r in records) else 1)
+
+    allowed = None
+    if args.mode == "validate_locked":
+        if not IMMUTABLE_RULESET:
+            print("⚠️ IMMUTABLE_RULESET is False, locked mode disabled")
             sys.exit(1)
-        print("✅ Spec is syntactically valid and checksum matches")
-        sys.exit(0)
+        allowed = load_allowed_checksums(quiet=compact)
+
+    if args.format == "jsonl":
+        renderer = render_jsonl
+    elif args.quiet:
+        renderer = render_quiet
+    elif allowed is not None:
+        renderer = render_banner
+    else:
+        renderer = render_text
+
+    ok = True
+    with report_writer() if compact else contextlib.nullcontext(sys.stdout) as out:
+        for spec in args.spec:
+            record = check_spec(spec, allowed)
+            renderer(record, out)
+            ok = ok and record["verdict"] == "PASS"
+    sys.exit(0 if ok else 1)
 
 
 if __name__ == "__main__":
@@ -1,136 +1,304 @@
 #!/usr/bin/env python3
 """
 HammerLang Compression Benchmark - Validación Empírica
-Mide la compresión REAL vs las afirmaciones teóricas
+Mide la compresión REAL (tokens de prosa / tokens del spec) sobre un corpus
+de pares .hml/prosa, con tokenizadores enchufables y 100% offline.
+
+Corpus: cada `X.hml` se empareja con `X.txt` o `X.md` en el mismo directorio
+(por defecto examples/).
+
+Uso:
+    python hammerlang_benchmark.py
+    python hammerlang_benchmark.py --corpus specs_corpus/ \\
+        --bpe gpt2=vocab.json,merges.txt --output benchmark_results.json
 """
 
+import abc
+import argparse
+import concurrent.futures
 import json
-from typing import Dict, List, Tuple
-
-# Simulador simple de tokenización (aproximación - en prod usar tiktoken/transformers)
-def estimate_tokens(text: str) -> int:
-    """Estimación conservadora de tokens (palabras + símbolos especiales)"""
-    # Aproximación: palabra promedio = 1.3 tokens, símbolos = 1-2 tokens cada uno
-    words = len(text.split())
-    special_chars = len([c for c in text if ord(c) > 127])
-    return int(words * 1.3 + special_chars * 1.5)
-
-# Test cases reales del Logic Lock Protocol
-test_cases = [
-    {
-        "name": "Dual-Threshold Lock State",
-        "original": """The Dual-Threshold Lock State triggers if ANY of the following: (1) E(G) < θ_lock [absolute degradation] (2) signed_rate(t) < -ε_sensitivity for k windows [rate-based] (3) Var(E[t-τ:t]) > V_threshold AND mean(E) < E_baseline - σ [variance-based, catches 'dancing' coherence]""",
-        "hammerlang": "#LLP:DTL:v1.0\n!LOCK⋈⦿[@E(G)<θ↓,Δ⧖(ε↑,k),σ²>V⋔μ<~E-σ]%dancing ⊨a3f9",
-        "expected_claim": "45-65x"
-    },
-    {
-        "name": "FSM State Transitions",
-        "original": """The Finite State Machine transitions through four states: NORMAL (S0) transitions to DETECT (S1) when coherence drops below threshold θ or anomaly A is detected; DETECT transitions to LOCKED (S2) when rate degradation exceeds epsilon for k consecutive windows or variance exceeds threshold; LOCKED transitions to RECOVER (S3) on explicit override or exception X; RECOVER transitions back to NORMAL on successful recovery R.""",
-        "hammerlang": "#LLP:FSM:v1.0\n!FSM⋈[S0→S1:<θ|░A; S1→S2:Δ≺ε*k|σ>th; S2→S3:⟂|░X; S3→S0:░R] ⊨f8d1",
-        "expected_claim": "45-65x"
-    },
-    {
-        "name": "Lock Signal Format",
-        "original": """Standardized lock signal format consists of: protocol identifier (Logic Lock Protocol v1.3), action type (HALT), affected systems (AxB cross-product), coherence delta (ΔE=0.87), and Unix timestamp in milliseconds (ts=1640995200000).""",
-        "hammerlang": "#LLP:SIG:v1.0\n!SIG⊢[🜁|HALT|AxB|ΔE=0.87|ts=16409952e9] ⊨b7c2",
-        "expected_claim": "45-65x"
-    },
-    {
-        "name": "Implicit Contradiction Detection",
-        "original": """The system detects implicit contradictions through multi-hop reasoning: if proposition P and its negation ¬P are both asserted, or if the negation of P cannot be proven false (¬⊧¬P), and this contradiction is buried deep in the reasoning chain rather than surface-level, trigger the implicit contradiction handler.""",
-        "hammerlang": "#LLP:IMP:v1.0\n!IMP⊧[P∧¬P|¬⊧¬P|⦉buried⦊] ⊨c9e4",
-        "expected_claim": "35-55x"
-    },
-    {
-        "name": "LoRA Bypass Threat",
-        "original": """Detect potential LoRA or PEFT adapter bypass attacks: if adapter introduces delta modifications that cause E(G) coherence mismatch compared to baseline, reject the adapter and flag as high-severity threat.""",
-        "hammerlang": "#LLP:THR:v1.0\n!THR⊢[adapterΔ|¬E(G)match|reject|~high] ⊨d2a5",
-        "expected_claim": "25-40x"
-    }
-]
-
-def analyze_compression(test_case: Dict) -> Dict:
-    """Analiza la compresión real vs el claim"""
-    original_tokens = estimate_tokens(test_case["original"])
-    compressed_tokens = estimate_tokens(test_case["hammerlang"])
-    
-    actual_ratio = original_tokens / compressed_tokens if compressed_tokens > 0 else 0
-    actual_savings = ((original_tokens - compressed_tokens) / original_tokens * 100) if original_tokens > 0 else 0
-    
-    # Parsear el claim esperado
-    expected_range = test_case["expected_claim"].replace("x", "").split("-")
-    expected_min = float(expected_range[0])
-    expected_max = float(expected_range[1]) if len(expected_range) > 1 else expected_min
-    
-    meets_claim = expected_min <= actual_ratio <= expected_max
-    
-    return {
-        "name": test_case["name"],
-        "original_tokens": original_tokens,
-        "compressed_tokens": compressed_tokens,
-        "actual_ratio": round(actual_ratio, 2),
-        "actual_savings_pct": round(actual_savings, 2),
-        "expected_claim": test_case["expected_claim"],
-        "meets_claim": meets_claim,
-        "delta_vs_min": round(actual_ratio - expected_min, 2),
-        "verdict": "✅ PASS" if meets_claim else f"❌ FAIL (off by {abs(round(actual_ratio - expected_min, 2))}x)"
-    }
-
-def run_benchmark():
+import os
+import re
+import statistics
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_CORPUS = Path("examples")
+PROSE_SUFFIXES = (".txt", ".md")
+
+
+# ---------------------------------------------------------------------
+# TOKENIZADORES
+# ---------------------------------------------------------------------
+
+class Tokenizer(abc.ABC):
+    """Interfaz de tokenizador: encode() devuelve ids, count() solo la cantidad."""
+
+    name = "base"
+
+    @abc.abstractmethod
+    def encode(self, text: str) -> List[int]:
+        """Ids de tokens del texto."""
+
+    def count(self, text: str) -> int:
+        return len(self.encode(text))
+
+
+class HeuristicTokenizer(Tokenizer):
+    """Estimación histórica (palabras * 1.3 + no-ASCII * 1.5). Solo como referencia."""
+
+    name = "heuristic"
+
+    def encode(self, text: str) -> List[int]:
+        return list(range(self.count(text)))
+
+    def count(self, text: str) -> int:
+        words = len(text.split())
+        special_chars = len([c for c in text if ord(c) > 127])
+        return int(words * 1.3 + special_chars * 1.5)
+
+
+# Pre-tokenización estilo GPT-2 con `re` de la stdlib ([^\W\d_] ~ \p{L}).
+# `_` no es letra ni dígito: GPT-2 lo trata como puntuación, así que va en esa rama.
+PRETOKENIZE_RE = re.compile(
+    r"""'s|'t|'re|'ve|'m|'ll|'d| ?[^\W\d_]+| ?\d+| ?(?:[^\s\w]|_)+|\s+(?!\S)|\s+"""
+)
+
+
+def bytes_to_unicode() -> Dict[int, str]:
+    """Mapa byte -> carácter imprimible usado por los vocabularios BPE byte-level (GPT-2)."""
+    bs = list(range(ord("!"), ord("~") + 1)) + list(range(ord("¡"), ord("¬") + 1)) \
+        + list(range(ord("®"), ord("ÿ") + 1))
+    cs = bs[:]
+    n = 0
+    for b in range(256):
+        if b not in bs:
+            bs.append(b)
+            cs.append(256 + n)
+            n += 1
+    return dict(zip(bs, (chr(c) for c in cs)))
+
+
+BYTE_ENCODER = bytes_to_unicode()
+
+
+class BPETokenizer(Tokenizer):
+    """
+    BPE byte-level cargado desde archivos locales (vocab.json + merges.txt, formato GPT-2).
+
+    El encoder cachea cada pre-token ya codificado y count() agrupa los
+    pre-tokens repetidos (Counter) para codificar cada pieza distinta una sola vez.
+    """
+
+    def __init__(self, name: str, vocab: Dict[str, int], merges: List[Tuple[str, str]]):
+        self.name = name
+        self.vocab = vocab
+        self.ranks = {pair: i for i, pair in enumerate(merges)}
+        self.cache: Dict[str, Tuple[int, ...]] = {}
+
+    @classmethod
+    def from_files(cls, name: str, vocab_path: str, merges_path: str) -> "BPETokenizer":
+        with open(vocab_path, encoding="utf-8") as f:
+            vocab = json.load(f)
+        merges = []
+        with open(merges_path, encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("#version") or not line.strip():
+                    continue
+                left, right = line.rstrip("\n").split(" ")
+                merges.append((left, right))
+        return cls(name, vocab, merges)
+
+    def _bpe(self, piece: str) -> List[str]:
+        word = [BYTE_ENCODER[b] for b in piece.encode("utf-8")]
+        while len(word) > 1:
+            ranked = [(self.ranks.get(pair, -1), i)
+                      for i, pair in enumerate(zip(word, word[1:]))]
+            ranked = [(r, i) for r, i in ranked if r >= 0]
+            if not ranked:
+                break
+            best = min(ranked)[0]
+            merged: List[str] = []
+            i = 0
+            while i < len(word):
+                if i + 1 < len(word) and self.ranks.get((word[i], word[i + 1])) == best:
+                    merged.append(word[i] + word[i + 1])
+                    i += 2
+                else:
+                    merged.append(word[i])
+                    i += 1
+            word = merged
+        return word
+
+    def encode_piece(self, piece: str) -> Tuple[int, ...]:
+        ids = self.cache.get(piece)
+        if ids is None:
+            ids = tuple(self.vocab[tok] for tok in self._bpe(piece))
+            self.cache[piece] = ids
+        return ids
+
+    def encode(self, text: str) -> List[int]:
+        ids: List[int] = []
+        for piece in PRETOKENIZE_RE.findall(text):
+            ids.extend(self.encode_piece(piece))
+        return ids
+
+    def count(self, text: str) -> int:
+        pieces = Counter(PRETOKENIZE_RE.findall(text))
+        return sum(n * len(self.encode_piece(piece)) for piece, n in pieces.items())
+
+
+def build_tokenizers(specs: List[str]) -> List[Tokenizer]:
+    """
+    Construye tokenizadores desde specs de CLI:
+    "heuristic" o "NAME=VOCAB.json,MERGES.txt" (BPE local).
+    """
+    tokenizers: List[Tokenizer] = []
+    for spec in specs:
+        if spec == "heuristic":
+            tokenizers.append(HeuristicTokenizer())
+            continue
+        name, _, paths = spec.partition("=")
+        vocab_path, _, merges_path = paths.partition(",")
+        if not (name and vocab_path and merges_path):
+            raise ValueError(f"Invalid tokenizer spec {spec!r} (expected NAME=VOCAB,MERGES)")
+        tokenizers.append(BPETokenizer.from_files(name, vocab_path, merges_path))
+    return tokenizers
+
+
+# ---------------------------------------------------------------------
+# CORPUS Y EJECUCIÓN EN PARALELO
+# ---------------------------------------------------------------------
+
+def load_corpus(root: Path) -> List[Tuple[str, str]]:
+    """Pares (spec .hml, prosa) encontrados recursivamente bajo root."""
+    pairs = []
+    for spec in sorted(root.rglob("*.hml")):
+        for suffix in PROSE_SUFFIXES:
+            prose = spec.with_suffix(suffix)
+            if prose.is_file():
+                pairs.append((str(spec), str(prose)))
+                break
+    return pairs
+
+
+_WORKER_TOKENIZERS: List[Tokenizer] = []
+
+
+def _init_worker(specs: List[str]) -> None:
+    """Cada worker construye sus tokenizadores una vez (y mantiene su propio cache)."""
+    global _WORKER_TOKENIZERS
+    _WORKER_TOKENIZERS = build_tokenizers(specs)
+
+
+def analyze_pair(pair: Tuple[str, str]) -> Dict:
+    """Tokens de prosa y de spec por tokenizador para un par del corpus."""
+    spec_path, prose_path = pair
+    spec = Path(spec_path).read_text(encoding="utf-8")
+    prose = Path(prose_path).read_text(encoding="utf-8")
+    result = {"spec": spec_path, "prose": prose_path, "tokenizers": {}}
+    for tok in _WORKER_TOKENIZERS:
+        prose_tokens = tok.count(prose)
+        spec_tokens = tok.count(spec)
+        result["tokenizers"][tok.name] = {
+            "prose_tokens": prose_tokens,
+            "spec_tokens": spec_tokens,
+            "ratio": round(prose_tokens / spec_tokens, 3) if spec_tokens else 0.0,
+        }
+    return result
+
+
+def run_corpus(pairs: List[Tuple[str, str]], specs: List[str],
+               jobs: Optional[int] = None) -> List[Dict]:
+    """Analiza el corpus en un pool de procesos (serial con jobs=1)."""
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1 or len(pairs) <= 1:
+        _init_worker(specs)
+        return [analyze_pair(p) for p in pairs]
+    chunksize = max(1, len(pairs) // (jobs * 4))
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(specs,)
+    ) as pool:
+        return list(pool.map(analyze_pair, pairs, chunksize=chunksize))
+
+
+def summarize(results: List[Dict]) -> Dict[str, Dict]:
+    """Distribución de ratios de compresión y tokens de spec por tokenizador."""
+    summary: Dict[str, Dict] = {}
+    names = results[0]["tokenizers"].keys() if results else []
+    for name in names:
+        ratios = sorted(r["tokenizers"][name]["ratio"] for r in results)
+        spec_tokens = sorted(r["tokenizers"][name]["spec_tokens"] for r in results)
+        if len(ratios) >= 2:
+            cuts = statistics.quantiles(ratios, n=20, method="inclusive")
+            p5, p95 = cuts[0], cuts[-1]
+        else:
+            p5 = p95 = ratios[0]
+        summary[name] = {
+            "pairs": len(ratios),
+            "ratio_min": ratios[0],
+            "ratio_p5": round(p5, 3),
+            "ratio_median": round(statistics.median(ratios), 3),
+            "ratio_mean": round(statistics.fmean(ratios), 3),
+            "ratio_p95": round(p95, 3),
+            "ratio_max": ratios[-1],
+            "spec_tokens_median": statistics.median(spec_tokens),
+            "spec_tokens_max": spec_tokens[-1],
+        }
+    return summary
+
+
+def run_benchmark(corpus: Path = DEFAULT_CORPUS, specs: Optional[List[str]] = None,
+                  jobs: Optional[int] = None) -> Dict:
     """Ejecuta el benchmark completo"""
+    specs = specs or ["heuristic"]
+    pairs = load_corpus(corpus)
+
     print("=" * 80)
     print("HAMMERLANG COMPRESSION BENCHMARK - Validación Empírica")
     print("=" * 80)
+    print(f"Corpus: {corpus} ({len(pairs)} pares) | tokenizadores: {', '.join(specs)}")
     print()
-    
-    results = []
-    for test_case in test_cases:
-        result = analyze_compression(test_case)
-        results.append(result)
-    
-    # Reporte detallado
-    for i, result in enumerate(results, 1):
-        print(f"{i}. {result['name']}")
-        print(f"   Original: {result['original_tokens']} tokens")
-        print(f"   Compressed: {result['compressed_tokens']} tokens")
-        print(f"   Ratio actual: {result['actual_ratio']}x ({result['actual_savings_pct']}% ahorro)")
-        print(f"   Claim esperado: {result['expected_claim']}")
-        print(f"   {result['verdict']}")
+
+    if not pairs:
+        print("❌ Corpus vacío: se esperan pares X.hml + X.txt/X.md")
+        return {"pairs": [], "summary": {}}
+
+    results = run_corpus(pairs, specs, jobs)
+    summary = summarize(results)
+
+    for name, s in summary.items():
+        print(f"{name}")
+        print(f"   Ratio (prosa/spec): min {s['ratio_min']}x | p5 {s['ratio_p5']}x | "
+              f"mediana {s['ratio_median']}x | p95 {s['ratio_p95']}x | max {s['ratio_max']}x")
+        print(f"   Tokens por spec: mediana {s['spec_tokens_median']} | max {s['spec_tokens_max']}")
         print()
-    
-    # Estadísticas agregadas
-    avg_ratio = sum(r['actual_ratio'] for r in results) / len(results)
-    avg_savings = sum(r['actual_savings_pct'] for r in results) / len(results)
-    pass_rate = sum(1 for r in results if r['meets_claim']) / len(results) * 100
-    
-    print("=" * 80)
-    print("RESUMEN AGREGADO")
-    print("=" * 80)
-    print(f"Promedio de compresión: {avg_ratio:.2f}x")
-    print(f"Promedio de ahorro: {avg_savings:.2f}%")
-    print(f"Tasa de éxito vs claims: {pass_rate:.1f}%")
-    print()
-    
-    # Veredicto final
-    if pass_rate >= 80:
-        print("✅ VEREDICTO: Claims de compresión VALIDADOS")
-    elif pass_rate >= 50:
-        print("⚠️ VEREDICTO: Claims parcialmente validados - necesita ajuste")
-    else:
-        print("❌ VEREDICTO: Claims NO validados - compresión sobrestimada")
-    
-    print()
-    print("NOTA: Esta es una estimación conservadora usando tokenización aproximada.")
-    print("Para validación definitiva, usar tiktoken (GPT) o tokenizadores reales de cada LLM.")
+
+    if "heuristic" in summary and len(summary) == 1:
+        print("NOTA: 'heuristic' es una estimación; para presupuestos de contexto usar --bpe")
+        print("con el vocabulario/merges local del modelo destino.")
     print("=" * 80)
-    
-    return results
+    return {"pairs": results, "summary": summary}
+
 
 if __name__ == "__main__":
-    results = run_benchmark()
-    
+    parser = argparse.ArgumentParser(description="HammerLang compression benchmark (offline)")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS,
+                        help="Directory with X.hml + X.txt/X.md pairs (default: examples/)")
+    parser.add_argument("--bpe", action="append", default=[], metavar="NAME=VOCAB,MERGES",
+                        help="Local byte-level BPE tokenizer (repeatable)")
+    parser.add_argument("--no-heuristic", action="store_true",
+                        help="Skip the words*1.3 heuristic baseline")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON results file")
+    args = parser.parse_args()
+
+    specs = ([] if args.no_heuristic else ["heuristic"]) + args.bpe
+    report = run_benchmark(args.corpus, specs, args.jobs)
+
     # Guardar resultados en JSON para análisis posterior
-    with open("/home/claude/benchmark_results.json", "w") as f:
-        json.dump(results, f, indent=2)
-    
-    print("\nResultados guardados en: benchmark_results.json")
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    print(f"\nResultados guardados en: {args.output}")
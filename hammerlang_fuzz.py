@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+HammerLang Fuzz & Timing Harness - Hardening contra input hostil
+Genera inputs adversariales y verifica que cada etapa de validación
+escala linealmente (sin backtracking catastrófico / ReDoS).
+
+Uso:
+    python hammerlang_fuzz.py            # tamaños completos (hasta varios MB)
+    python hammerlang_fuzz.py --quick    # tamaños reducidos (CI)
+"""
+
+import argparse
+import math
+import sys
+import time
+from typing import Callable, Dict, List
+
+import hammerlang as hl
+
+HEADER = "#BANK:LCR:v1.1\n"
+SEAL = "⊨a5e9f3a7"
+
+# Pendiente log-log máxima aceptada entre el tamaño menor y el mayor.
+# 1.0 = lineal perfecto; el margen absorbe ruido de medición y efectos de caché.
+MAX_SLOPE = 1.35
+# Por debajo de este tiempo (segundos) la medición es ruido: no se evalúa la pendiente.
+NOISE_FLOOR = 1e-3
+REPEATS = 3
+
+
+# ---------------------------------------------------------------------
+# GENERADORES ADVERSARIALES (n = tamaño aproximado en caracteres)
+# ---------------------------------------------------------------------
+
+def gen_whitespace_run(n: int) -> str:
+    """Marcador seguido de un run enorme de whitespace que no termina en fin de línea."""
+    return HEADER + SEAL + " " * n + "x\n"
+
+
+def gen_multiline_whitespace(n: int) -> str:
+    """Muchos marcadores separados por bloques de whitespace multilínea."""
+    block = SEAL + " \n" * 8 + "x"
+    return HEADER + block * (n // len(block))
+
+
+def gen_many_markers(n: int) -> str:
+    """Millones de '⊨' consecutivos (candidatos que fallan en [a-f0-9]{8})."""
+    return HEADER + "⊨" * n + "\n" + SEAL + "\n"
+
+
+def gen_many_seal_candidates(n: int) -> str:
+    """Sellos casi válidos: cada uno falla el lookahead por un carácter."""
+    unit = SEAL + " x"
+    return HEADER + unit * (n // len(unit)) + "\n"
+
+
+def gen_huge_line(n: int) -> str:
+    """Una sola línea gigante sin saltos."""
+    return HEADER + "A" * n + "\n" + SEAL + "\n"
+
+
+def gen_header_backtrack(n: int) -> str:
+    """Líneas '#AAAA...' que casi matchean HEADER_RE y fuerzan backtracking."""
+    unit = "#" + "A" * 30 + ":" + "B" * 30 + ":v1\n"
+    return unit * (n // len(unit)) + SEAL + "\n"
+
+
+def gen_deep_nesting(n: int) -> str:
+    """Anidamiento profundo de corchetes."""
+    half = n // 2
+    return HEADER + "[" * half + "]" * half + "\n" + SEAL + "\n"
+
+
+def gen_nfkc_expanding(n: int) -> str:
+    """Caracteres que NFKC expande ~18x (U+FDFA) y ligaduras."""
+    unit = "ﷺﬁ"
+    return HEADER + unit * (n // len(unit)) + "\n" + SEAL + "\n"
+
+
+GENERATORS: Dict[str, Callable[[int], str]] = {
+    "whitespace_run": gen_whitespace_run,
+    "multiline_whitespace": gen_multiline_whitespace,
+    "many_markers": gen_many_markers,
+    "many_seal_candidates": gen_many_seal_candidates,
+    "huge_line": gen_huge_line,
+    "header_backtrack": gen_header_backtrack,
+    "deep_nesting": gen_deep_nesting,
+    "nfkc_expanding": gen_nfkc_expanding,
+}
+
+
+# ---------------------------------------------------------------------
+# ETAPAS A MEDIR
+# ---------------------------------------------------------------------
+
+STAGES: Dict[str, Callable[[str], object]] = {
+    "header_re": lambda code: hl.HEADER_RE_COMPILED.search(code),
+    "checksum_re": lambda code: hl.CHECKSUM_RE.search(code),
+    "extract_checksum": hl.extract_checksum,
+    "strip_checksum_line": hl.strip_checksum_line,
+    "validate_symbols": hl.validate_symbols,
+    "robust_checksum": hl.robust_checksum,
+    "validate_syntax": hl.validate_syntax,
+    "checksum_issues": hl.checksum_issues,
+}
+
+
+def time_stage(stage: Callable[[str], object], code: str) -> float:
+    """Mejor tiempo (segundos) de REPEATS ejecuciones."""
+    best = math.inf
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        stage(code)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def loglog_slope(sizes: List[int], times: List[float]) -> float:
+    """Pendiente entre el primer y el último punto en escala log-log."""
+    t0 = max(times[0], 1e-6)
+    t1 = max(times[-1], 1e-6)
+    return math.log(t1 / t0) / math.log(sizes[-1] / sizes[0])
+
+
+def run_scaling(sizes: List[int]) -> List[dict]:
+    """Mide cada etapa sobre cada generador y calcula la pendiente de crecimiento."""
+    results = []
+    # Las etapas con presupuesto rechazarían los inputs grandes antes de trabajar:
+    # se levanta el límite para medir el costo real del algoritmo.
+    saved_max, saved_budget = hl.MAX_SPEC_BYTES, hl.SPEC_TIME_BUDGET
+    hl.MAX_SPEC_BYTES, hl.SPEC_TIME_BUDGET = sys.maxsize, math.inf
+    try:
+        for gen_name, gen in GENERATORS.items():
+            inputs = [gen(n) for n in sizes]
+            for stage_name, stage in STAGES.items():
+                times = [time_stage(stage, code) for code in inputs]
+                slope = loglog_slope(sizes, times)
+                results.append({
+                    "generator": gen_name,
+                    "stage": stage_name,
+                    "times_ms": [round(t * 1000, 3) for t in times],
+                    "slope": round(slope, 2),
+                    "linear": slope <= MAX_SLOPE or times[-1] < NOISE_FLOOR,
+                })
+    finally:
+        hl.MAX_SPEC_BYTES, hl.SPEC_TIME_BUDGET = saved_max, saved_budget
+    return results
+
+
+def run_budget_checks() -> List[dict]:
+    """Verifica que un spec hostil sobre el presupuesto se rechaza sin procesarlo."""
+    results = []
+    oversized = hl.MAX_SPEC_BYTES * 4
+    for gen_name, gen in GENERATORS.items():
+        code = gen(oversized)
+        t0 = time.perf_counter()
+        syntax = hl.validate_syntax(code)
+        checksum = hl.checksum_issues(code)
+        elapsed = time.perf_counter() - t0
+        rejected = any("size budget" in i for i in syntax) and any("size budget" in i for i in checksum)
+        results.append({
+            "generator": gen_name,
+            "chars": len(code),
+            "elapsed_ms": round(elapsed * 1000, 3),
+            "rejected": rejected,
+        })
+    return results
+
+
+def run_fuzz(quick: bool = False) -> bool:
+    """Ejecuta el harness completo. Devuelve True si todas las etapas son lineales."""
+    base = 1 << 16 if quick else 1 << 18
+    sizes = [base, base * 2, base * 4, base * 8]
+
+    print("=" * 80)
+    print("HAMMERLANG FUZZ & TIMING HARNESS - Inputs adversariales")
+    print("=" * 80)
+    print(f"Tamaños: {', '.join(str(n) for n in sizes)} chars | pendiente máx: {MAX_SLOPE}")
+    print()
+
+    scaling = run_scaling(sizes)
+    for r in scaling:
+        mark = "✅" if r["linear"] else "❌"
+        print(f"{mark} {r['generator']:<22} {r['stage']:<20} slope={r['slope']:<5} "
+              f"ms={r['times_ms']}")
+
+    print()
+    print("Presupuestos por spec (MAX_SPEC_BYTES / SPEC_TIME_BUDGET):")
+    budgets = run_budget_checks()
+    for r in budgets:
+        mark = "✅" if r["rejected"] else "❌"
+        print(f"{mark} {r['generator']:<22} {r['chars']} chars rechazado en {r['elapsed_ms']} ms")
+
+    ok = all(r["linear"] for r in scaling) and all(r["rejected"] for r in budgets)
+    print()
+    print("=" * 80)
+    print("✅ VEREDICTO: todas las etapas son lineales" if ok
+          else "❌ VEREDICTO: crecimiento superlineal o presupuesto no aplicado")
+    print("=" * 80)
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HammerLang fuzz/timing harness")
+    parser.add_argument("--quick", action="store_true", help="Reduced sizes for CI")
+    args = parser.parse_args()
+    sys.exit(0 if run_fuzz(args.quick) else 1)
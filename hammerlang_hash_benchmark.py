@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+HammerLang Seal Hash Benchmark - Throughput por algoritmo de sello
+Compara legacy (SHA-256 truncado), SHA-256 completo y BLAKE2b-256
+sobre specs de distintos tamaños.
+
+Uso:
+    python hammerlang_hash_benchmark.py
+    python hammerlang_hash_benchmark.py --output hash_benchmark_results.json
+"""
+
+import argparse
+import json
+import time
+from typing import Dict, List
+
+from hammerlang import SEAL_ALGORITHMS, robust_checksum
+
+# Tamaños de spec (bytes): desde specs típicos hasta el límite MAX_SPEC_BYTES
+SPEC_SIZES = [256, 4 * 1024, 64 * 1024, 1024 * 1024]
+# Bytes totales a hashear por medición (acota el tiempo en specs chicos)
+BYTES_PER_RUN = 32 * 1024 * 1024
+REPEATS = 3
+
+SPEC_LINE = "CONSTRAINT LEVEL2B ≤ 0.15 * STOCK_HQLA\n"
+
+
+def make_spec(size: int) -> str:
+    """Spec sintético de ~size bytes UTF-8."""
+    line_bytes = len(SPEC_LINE.encode("utf-8"))
+    return "#BANK:LCR:v1.1\n" + SPEC_LINE * max(1, size // line_bytes)
+
+
+def measure(algorithm: str, spec: str) -> float:
+    """Throughput en MB/s de robust_checksum() (incluye el encode UTF-8, como en producción)."""
+    size = len(spec.encode("utf-8"))
+    iterations = max(1, BYTES_PER_RUN // size)
+    best = float("inf")
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            robust_checksum(spec, algorithm)
+        best = min(best, time.perf_counter() - t0)
+    return size * iterations / best / 1e6
+
+
+def run_benchmark() -> List[Dict]:
+    """Ejecuta el benchmark completo"""
+    print("=" * 80)
+    print("HAMMERLANG SEAL HASH BENCHMARK - MB/s por algoritmo y tamaño de spec")
+    print("=" * 80)
+    print()
+
+    results = []
+    header = f"{'size':>10} " + " ".join(f"{alg:>12}" for alg in SEAL_ALGORITHMS)
+    print(header)
+    for size in SPEC_SIZES:
+        spec = make_spec(size)
+        row = {"size_bytes": len(spec.encode("utf-8"))}
+        for algorithm in SEAL_ALGORITHMS:
+            row[algorithm] = round(measure(algorithm, spec), 1)
+        results.append(row)
+        print(f"{row['size_bytes']:>10} " + " ".join(f"{row[alg]:>12}" for alg in SEAL_ALGORITHMS))
+
+    print()
+    print("NOTA: legacy y sha256 cuestan lo mismo (mismo digest, distinto truncado).")
+    print("BLAKE2b gana en hosts sin SHA-NI; con SHA-NI, SHA-256 puede ser más rápido.")
+    print("=" * 80)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HammerLang seal hash benchmark")
+    parser.add_argument("--output", help="Optional JSON file for the results")
+    args = parser.parse_args()
+
+    results = run_benchmark()
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResultados guardados en: {args.output}")
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+HammerLang Snapshot — Spec validado compartido entre procesos
+
+Un supervisor valida el spec una sola vez (Production Locked Mode) y publica
+un snapshot inmutable y versionado en un archivo memory-mapped (por defecto en
+/dev/shm). Los workers lo adjuntan con mmap (zero-copy, páginas compartidas por
+el kernel) y cambian de generación de forma atómica cuando el supervisor publica
+una nueva.
+
+Formato (little-endian):
+    header  MAGIC | format | generation | meta_len | spec_len | compiled_len
+    meta    JSON: path, checksum, audit, published_at
+    spec    bytes UTF-8 del texto validado (newlines normalizados a LF)
+    compiled JSON de las estructuras compiladas (compile_spec)
+
+Publicación: se escribe un archivo temporal y se hace os.replace() sobre el
+path; los workers que todavía mapean la generación anterior la siguen leyendo
+intacta (el inodo viejo vive hasta que se suelta el último mapeo).
+
+Solo se publican specs que pasan Production Locked Mode (sellados y en la
+allowlist). Los specs AICL del repo todavía no pasan en este build (namespace
+AICL fuera de ALLOWED_NAMESPACES y comentarios con ';'), así que el flujo es
+sellar y aprobar el spec propio antes de publicarlo.
+
+Usage:
+    python hammerlang.py seal specs/mi_spec.hml --write
+    python hammerlang.py approve specs/mi_spec.hml --signed-by "Nombre @handle"
+    python hammerlang_snapshot.py publish specs/mi_spec.hml [--snapshot PATH]
+    python hammerlang_snapshot.py show [--snapshot PATH]
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import hammerlang as hl
+
+MAGIC = b"HMLSNAP1"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sIQIQQ")
+
+_SHM_DIR = Path("/dev/shm")
+DEFAULT_SNAPSHOT_PATH = (_SHM_DIR if _SHM_DIR.is_dir() else Path(tempfile.gettempdir())) \
+    / "hammerlang_spec.snap"
+
+
+# ---------------------------------------------------------------------
+# COMPILACIÓN
+# ---------------------------------------------------------------------
+
+def compile_spec(code: str) -> dict:
+    """
+    Estructuras pre-parseadas que los workers reutilizan sin re-parsear:
+    header (namespace, spec, versión) y sentencias sin comentarios ni sello.
+    """
+    m = hl.HEADER_RE_COMPILED.search(code)
+    statements = [
+        line.strip()
+        for line in hl.strip_checksum_line(code).splitlines()
+        if line.strip() and not line.lstrip().startswith((";", "#"))
+    ]
+    return {
+        "header": {"namespace": m.group(1), "spec": m.group(2),
+                   "version": m.group(0).rsplit(":", 1)[1]} if m else None,
+        "statements": statements,
+    }
+
+
+# ---------------------------------------------------------------------
+# SUPERVISOR
+# ---------------------------------------------------------------------
+
+def read_generation(snapshot_path: Union[str, Path]) -> int:
+    """Generación publicada actualmente (0 si no hay snapshot válido)."""
+    try:
+        with open(snapshot_path, "rb") as f:
+            raw = f.read(HEADER.size)
+    except FileNotFoundError:
+        return 0
+    if len(raw) < HEADER.size:
+        return 0
+    magic, _, generation, _, _, _ = HEADER.unpack(raw)
+    return generation if magic == MAGIC else 0
+
+
+def publish_snapshot(
+    spec_path: str,
+    snapshot_path: Union[str, Path] = DEFAULT_SNAPSHOT_PATH,
+    allowed: Optional[Dict[str, Union[str, dict]]] = None,
+) -> dict:
+    """
+    Valida el spec en Production Locked Mode y, si pasa, publica una nueva
+    generación con el texto validado (newlines normalizados a LF). Devuelve
+    el registro de check_spec() con "generation" (None si no se publicó; la
+    generación anterior queda vigente).
+    """
+    if not hl.IMMUTABLE_RULESET:
+        return {"path": spec_path, "verdict": "FAIL", "stage": "locked", "generation": None,
+                "issues": ["⚠️ IMMUTABLE_RULESET is False, locked mode disabled"]}
+
+    if allowed is None:
+        allowed = hl.load_allowed_checksums(quiet=True)
+    # Se publica exactamente el texto validado (una sola lectura): releer el
+    # archivo abriría una carrera y perdería la normalización de newlines.
+    record, code = hl.check_spec_code(spec_path, allowed)
+    record["generation"] = None
+    if record["verdict"] != "PASS":
+        return record
+
+    spec_bytes = code.encode("utf-8")
+    compiled = json.dumps(compile_spec(code),
+                          ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    snapshot_path = Path(snapshot_path)
+    generation = read_generation(snapshot_path) + 1
+    meta = json.dumps({
+        "path": spec_path,
+        "checksum": record["checksum"],
+        "audit": record["audit"],
+        "published_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, generation, len(meta), len(spec_bytes), len(compiled))
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=snapshot_path.name + ".", dir=snapshot_path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header + meta + spec_bytes + compiled)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, snapshot_path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+    record["generation"] = generation
+    return record
+
+
+# ---------------------------------------------------------------------
+# WORKERS
+# ---------------------------------------------------------------------
+
+class SpecSnapshot:
+    """
+    Vista de solo lectura sobre una generación mapeada.
+    `spec` y `compiled_bytes` son memoryviews sobre el mmap (zero-copy).
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            self.inode = (st.st_dev, st.st_ino)
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(self._map)
+        if len(view) < HEADER.size:
+            raise ValueError(f"{path}: truncated snapshot header")
+        magic, fmt, generation, meta_len, spec_len, compiled_len = HEADER.unpack_from(view)
+        if magic != MAGIC or fmt != FORMAT_VERSION:
+            raise ValueError(f"{path}: not a HammerLang snapshot (format {fmt})")
+        end = HEADER.size + meta_len + spec_len + compiled_len
+        if end > len(view):
+            raise ValueError(f"{path}: truncated snapshot body")
+
+        self.generation = generation
+        offset = HEADER.size
+        self.meta = json.loads(bytes(view[offset:offset + meta_len]))
+        offset += meta_len
+        self.spec = view[offset:offset + spec_len]
+        offset += spec_len
+        self.compiled_bytes = view[offset:offset + compiled_len]
+        self._compiled: Optional[dict] = None
+
+    @property
+    def checksum(self) -> str:
+        return self.meta["checksum"]
+
+    @property
+    def audit(self) -> dict:
+        return self.meta["audit"]
+
+    def spec_text(self) -> str:
+        """Decodifica el spec (copia); usar `spec` para acceso zero-copy."""
+        return str(self.spec, "utf-8")
+
+    def compiled(self) -> dict:
+        """Estructuras compiladas, decodificadas una vez por worker y generación."""
+        if self._compiled is None:
+            self._compiled = json.loads(bytes(self.compiled_bytes))
+        return self._compiled
+
+
+class SnapshotReader:
+    """
+    Adjunta el snapshot publicado y cambia de generación cuando el supervisor
+    publica otra. get() cuesta un stat(): el swap es atómico porque cada
+    generación es un inodo distinto e inmutable.
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_SNAPSHOT_PATH):
+        self.path = Path(path)
+        self.current: Optional[SpecSnapshot] = None
+
+    def get(self) -> SpecSnapshot:
+        st = os.stat(self.path)
+        if self.current is None or self.current.inode != (st.st_dev, st.st_ino):
+            # La generación anterior se libera cuando nadie conserva vistas sobre ella
+            self.current = SpecSnapshot(self.path)
+        return self.current
+
+
+# ---------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HammerLang shared spec snapshot")
+    sub = parser.add_subparsers(dest="command")
+
+    pub = sub.add_parser("publish", help="Validate (locked mode) and publish a new generation")
+    pub.add_argument("spec", help="Path to HammerLang spec")
+    pub.add_argument("--snapshot", default=str(DEFAULT_SNAPSHOT_PATH), help="Snapshot file")
+
+    show = sub.add_parser("show", help="Attach and print the current generation")
+    show.add_argument("--snapshot", default=str(DEFAULT_SNAPSHOT_PATH), help="Snapshot file")
+
+    args = parser.parse_args()
+
+    if args.command == "publish":
+        record = publish_snapshot(args.spec, args.snapshot)
+        if record["generation"] is None:
+            for i in record["issues"]:
+                print(i)
+            print("❌ Snapshot NOT published (previous generation stays active)")
+            sys.exit(1)
+        print(f"✅ Published {args.spec} ⊨{record['checksum']} "
+              f"as generation {record['generation']} -> {args.snapshot}")
+    elif args.command == "show":
+        try:
+            snap = SnapshotReader(args.snapshot).get()
+        except (OSError, ValueError) as e:
+            print(f"❌ Cannot attach snapshot: {e}")
+            sys.exit(1)
+        print(f"Generation: {snap.generation}")
+        print(f"Spec:       {snap.meta['path']} ({len(snap.spec)} bytes)")
+        print(f"Checksum:   {snap.checksum}")
+        print(f"Signed by:  {snap.audit['signed_by']} @ {snap.audit['timestamp']}")
+        print(f"Statements: {len(snap.compiled()['statements'])}")
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
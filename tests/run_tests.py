@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Parallel HammerLang test runner
+Runs the regression tier (hand-written asserts in tests/test_*.py) and the
+property tier (generated specs, sharded) in a process pool, failing any test
+that exceeds its time budget.
+
+Usage:
+    python tests/run_tests.py                      # all tiers, one worker per core
+    python tests/run_tests.py --tier regression
+    python tests/run_tests.py --tier property --shards 16 --jobs 4
+"""
+
+import argparse
+import concurrent.futures
+import contextlib
+import importlib
+import io
+import os
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+TESTS_DIR = Path(__file__).parent
+sys.path.insert(0, str(TESTS_DIR))
+sys.path.insert(0, str(TESTS_DIR.parent))
+
+REGRESSION_MODULES = ["test_lcr", "test_allowlist", "test_benchmark", "test_snapshot"]
+# Budget per regression test (seconds); generated cases carry their own per-case budget
+REGRESSION_BUDGET_S = 60.0
+# Property-tier checks besides the generated shards (generator determinism/coverage)
+PROPERTY_TESTS = ["test_generator_is_deterministic"]
+# Timing-sensitive tests (scaling slopes) run alone after the pool drains:
+# competing workers on the same cores would distort their measurements.
+SERIAL_TESTS = {"test_fuzz_harness_quick"}
+
+
+def collect_regression() -> List[Tuple[str, str]]:
+    """(module, function) de cada test_* del tier de regresión, en orden de definición."""
+    tasks = []
+    for name in REGRESSION_MODULES:
+        module = importlib.import_module(name)
+        for attr, fn in vars(module).items():
+            if attr.startswith("test_") and callable(fn):
+                tasks.append((name, attr))
+    return tasks
+
+
+def run_test(module_name: str, test_name: str) -> Tuple[bool, float, str]:
+    """Corre un test en el worker capturando su salida."""
+    out = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(out):
+            getattr(importlib.import_module(module_name), test_name)()
+        ok, detail = True, ""
+    except Exception:
+        ok, detail = False, out.getvalue() + traceback.format_exc()
+    return ok, time.perf_counter() - start, detail
+
+
+def run_property_shard(shard: int, shards: int) -> Tuple[bool, float, str]:
+    """Corre un shard de casos generados (cada caso controla su presupuesto)."""
+    import test_properties
+    start = time.perf_counter()
+    failures = test_properties.run_shard(shard, shards)
+    return not failures, time.perf_counter() - start, "\n".join(failures)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Parallel HammerLang test runner")
+    parser.add_argument("--tier", choices=["all", "regression", "property"], default="all")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--shards", type=int, default=None,
+                        help="Property-tier shards (default: 4 x jobs)")
+    args = parser.parse_args(argv)
+
+    # Los tests de regresión usan paths relativos a la raíz del repo
+    os.chdir(TESTS_DIR.parent)
+    jobs = args.jobs or os.cpu_count() or 1
+    shards = args.shards or jobs * 4
+
+    print("=" * 70)
+    print(f"HAMMERLANG PARALLEL TEST SUITE ({jobs} workers)")
+    print("=" * 70)
+
+    results = []
+    serial = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = []
+        if args.tier in ("all", "regression"):
+            for module_name, test_name in collect_regression():
+                label = f"regression {module_name}::{test_name}"
+                if test_name in SERIAL_TESTS:
+                    serial.append((label, module_name, test_name))
+                    continue
+                futures.append((label, REGRESSION_BUDGET_S,
+                                pool.submit(run_test, module_name, test_name)))
+        if args.tier in ("all", "property"):
+            for test_name in PROPERTY_TESTS:
+                futures.append((f"property test_properties::{test_name}", REGRESSION_BUDGET_S,
+                                pool.submit(run_test, "test_properties", test_name)))
+            for shard in range(shards):
+                futures.append((f"property shard {shard}/{shards}", None,
+                                pool.submit(run_property_shard, shard, shards)))
+
+        for label, budget, future in futures:
+            results.append((label, budget, future.result()))
+
+    for label, module_name, test_name in serial:
+        results.append((label, REGRESSION_BUDGET_S, run_test(module_name, test_name)))
+
+    failed = 0
+    total = len(results)
+    for label, budget, (ok, elapsed, detail) in results:
+        if ok and budget is not None and elapsed > budget:
+            ok, detail = False, f"{elapsed:.2f}s exceeds budget {budget:.0f}s"
+        print(f"{'✅' if ok else '❌'} {label} ({elapsed:.2f}s)")
+        if not ok:
+            failed += 1
+            print("   " + detail.strip().replace("\n", "\n   "))
+
+    print("=" * 70)
+    print(f"Passed: {total - failed}/{total}")
+    print(f"Failed: {failed}/{total}")
+    if failed == 0:
+        print("\n✅ ALL TESTS PASSED")
+        return 0
+    print(f"\n❌ {failed} TESTS FAILED")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Test suite for HammerLang seal/approve pipeline
+Tests sealing, approval journal replay, compaction and concurrent approvers
+"""
+
+import sys
+import json
+import time
+import tempfile
+import concurrent.futures
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import hammerlang
+from hammerlang import (
+    append_approvals,
+    approve_specs,
+    checksum_issues,
+    compact_allowlist,
+    read_allowlist,
+    seal_code,
+    seal_spec,
+)
+
+
+def _write_spec(tmp: Path, name: str, body: str) -> Path:
+    spec = tmp / name
+    spec.write_text(body, encoding="utf-8")
+    return spec
+
+
+def test_seal_code():
+    """Test that seal_code appends or replaces the seal and self-validates."""
+    print("Test 1: seal_code...")
+
+    sealed = seal_code("#BANK:TEST:v1.0\nX = 1\n")
+    assert sealed.splitlines()[-1].startswith("⊨"), "❌ Seal line should be last"
+    assert checksum_issues(sealed) == [], "❌ Sealed spec should self-validate"
+
+    resealed = seal_code(sealed.replace("X = 1", "X = 2"))
+    assert resealed.count("⊨") == 1, "❌ Old seal line should be replaced"
+    assert checksum_issues(resealed) == []
+    assert seal_code(sealed) == sealed, "❌ Sealing must be idempotent"
+
+    print("✅ PASSED: seal_code\n")
+
+
+def test_seal_spec_write():
+    """Test that seal_spec only rewrites the file with write=True."""
+    print("Test 2: seal_spec...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        spec = _write_spec(Path(tmp), "t.hml", "#BANK:TEST:v1.0\nX = 1\n")
+
+        dry = seal_spec(str(spec))
+        assert dry["checksum"] and not dry["written"]
+        assert "⊨" not in spec.read_text(encoding="utf-8"), "❌ Dry run must not write"
+
+        written = seal_spec(str(spec), write=True)
+        assert written["written"] and written["checksum"] == dry["checksum"]
+        assert seal_spec(str(spec), write=True)["written"] is False, "❌ Already sealed"
+
+        missing = seal_spec(str(Path(tmp) / "missing.hml"))
+        assert missing["issues"] and missing["checksum"] is None
+
+    print("✅ PASSED: seal_spec\n")
+
+
+def test_approve_specs():
+    """Test that only valid sealed specs are recorded in the journal."""
+    print("Test 3: approve_specs...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        snapshot = tmp / "allowed.json"
+        journal = tmp / "allowed.journal.jsonl"
+        good = _write_spec(tmp, "good.hml", seal_code("#BANK:GOOD:v1.0\nX = 1\n"))
+        unsealed = _write_spec(tmp, "bad.hml", "#BANK:BAD:v1.0\nX = 1\n")
+
+        records = approve_specs([str(good), str(unsealed)], "QA", jobs=1,
+                                snapshot=snapshot, journal=journal)
+        assert [r["verdict"] for r in records] == ["PASS", "FAIL"]
+        assert records[0]["audit"]["spec"] == "BANK:GOOD:v1.0"
+
+        lines = journal.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1, "❌ Only the valid spec should be journaled"
+        entry = json.loads(lines[0])
+        assert entry["checksum"] == records[0]["checksum"]
+        assert entry["signed_by"] == "QA" and entry["timestamp"].endswith("Z")
+
+    print("✅ PASSED: approve_specs\n")
+
+
+def test_journal_replay_last_wins():
+    """Test that journal entries override the snapshot and later ones win."""
+    print("Test 4: Journal replay...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        snapshot = tmp / "allowed.json"
+        journal = tmp / "allowed.journal.jsonl"
+        snapshot.write_text('{"aaaaaaaa": "legacy", "bbbbbbbb": "keep"}', encoding="utf-8")
+
+        append_approvals([{"checksum": "aaaaaaaa", "spec": "A", "signed_by": "first", "timestamp": "t1"}],
+                         snapshot, journal)
+        append_approvals([{"checksum": "aaaaaaaa", "spec": "A", "signed_by": "second", "timestamp": "t2"}],
+                         snapshot, journal)
+
+        data = read_allowlist(snapshot, journal)
+        assert data["aaaaaaaa"]["signed_by"] == "second", "❌ Last approval should win"
+        assert data["bbbbbbbb"] == "keep"
+
+    print("✅ PASSED: Journal replay\n")
+
+
+def test_read_has_no_side_effects():
+    """Test that loading the allowlist never creates the journal."""
+    print("Test 5: Read path side effects...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        snapshot = tmp / "allowed.json"
+        journal = tmp / "sub" / "allowed.journal.jsonl"
+        snapshot.write_text('{"aaaaaaaa": "legacy"}', encoding="utf-8")
+
+        assert read_allowlist(snapshot, journal) == {"aaaaaaaa": "legacy"}
+        assert not journal.parent.exists(), "❌ Reading must not create files"
+
+    print("✅ PASSED: Read path side effects\n")
+
+
+def test_compaction_threshold():
+    """Test that crossing ALLOWLIST_JOURNAL_MAX_BYTES compacts into the snapshot."""
+    print("Test 6: Compaction threshold...")
+
+    saved = hammerlang.ALLOWLIST_JOURNAL_MAX_BYTES
+    hammerlang.ALLOWLIST_JOURNAL_MAX_BYTES = 512
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            snapshot = tmp / "allowed.json"
+            journal = tmp / "allowed.journal.jsonl"
+
+            compacted = []
+            for i in range(20):
+                entry = {"checksum": f"{i:08x}", "spec": f"S{i}", "signed_by": "QA", "timestamp": "t"}
+                compacted.append(append_approvals([entry], snapshot, journal))
+
+            assert any(compacted), "❌ Journal should have been compacted"
+            assert journal.stat().st_size <= hammerlang.ALLOWLIST_JOURNAL_MAX_BYTES
+            data = read_allowlist(snapshot, journal)
+            assert len(data) == 20, "❌ Compaction must not lose approvals"
+
+            before = data
+            assert compact_allowlist(snapshot, journal) == 20
+            assert journal.read_text(encoding="utf-8") == ""
+            assert read_allowlist(snapshot, journal) == before
+    finally:
+        hammerlang.ALLOWLIST_JOURNAL_MAX_BYTES = saved
+
+    print("✅ PASSED: Compaction threshold\n")
+
+
+def test_concurrent_appends():
+    """Test that concurrent approvers neither lose nor interleave records."""
+    print("Test 7: Concurrent appends...")
+
+    saved = hammerlang.ALLOWLIST_JOURNAL_MAX_BYTES
+    hammerlang.ALLOWLIST_JOURNAL_MAX_BYTES = 4096
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            snapshot = tmp / "allowed.json"
+            journal = tmp / "allowed.journal.jsonl"
+
+            def approve(worker: int) -> None:
+                for i in range(25):
+                    entry = {"checksum": f"{worker:04x}{i:04x}", "spec": "S",
+                             "signed_by": f"w{worker}", "timestamp": "t"}
+                    append_approvals([entry], snapshot, journal)
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(approve, range(8)))
+
+            data = read_allowlist(snapshot, journal)
+            assert len(data) == 200, f"❌ Expected 200 approvals, got {len(data)}"
+    finally:
+        hammerlang.ALLOWLIST_JOURNAL_MAX_BYTES = saved
+
+    print("✅ PASSED: Concurrent appends\n")
+
+
+def test_readers_during_compaction():
+    """Test that readers racing journal creation and compaction never fail or lose approvals."""
+    print("Test 8: Readers during compaction...")
+
+    saved = hammerlang.ALLOWLIST_JOURNAL_MAX_BYTES
+    hammerlang.ALLOWLIST_JOURNAL_MAX_BYTES = 512
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            snapshot = tmp / "allowed.json"
+            journal = tmp / "allowed.journal.jsonl"
+
+            def approve() -> None:
+                for i in range(200):
+                    entry = {"checksum": f"{i:08x}", "spec": "S", "signed_by": "QA", "timestamp": "t"}
+                    append_approvals([entry], snapshot, journal)
+
+            def read() -> int:
+                # Cada lectura ve un estado consistente: nunca menos aprobaciones que la anterior
+                seen = 0
+                while seen < 200:
+                    count = len(read_allowlist(snapshot, journal))
+                    assert count >= seen, f"❌ Approvals lost: {count} < {seen}"
+                    seen = count
+                    time.sleep(0.001)
+                return seen
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+                readers = [pool.submit(read) for _ in range(3)]
+                pool.submit(approve).result()
+                assert all(r.result(timeout=30) == 200 for r in readers)
+    finally:
+        hammerlang.ALLOWLIST_JOURNAL_MAX_BYTES = saved
+
+    print("✅ PASSED: Readers during compaction\n")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 70)
+    print("HAMMERLANG SEAL/APPROVE TEST SUITE")
+    print("=" * 70)
+    print()
+
+    tests = [
+        test_seal_code,
+        test_seal_spec_write,
+        test_approve_specs,
+        test_journal_replay_last_wins,
+        test_read_has_no_side_effects,
+        test_compaction_threshold,
+        test_concurrent_appends,
+        test_readers_during_compaction,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("=" * 70)
+    print("TEST RESULTS")
+    print("=" * 70)
+    print(f"Passed: {passed}/{len(tests)}")
+    print(f"Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n✅ ALL TESTS PASSED")
+        return 0
+    else:
+        print(f"\n❌ {failed} TESTS FAILED")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test suite for the HammerLang compression benchmark
+Tests the local BPE tokenizer, corpus pairing and the parallel corpus run
+"""
+
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from hammerlang_benchmark import (
+    BYTE_ENCODER,
+    BPETokenizer,
+    PRETOKENIZE_RE,
+    Tokenizer,
+    build_tokenizers,
+    load_corpus,
+    run_corpus,
+    summarize,
+)
+
+
+def _write_bpe(tmp: Path) -> str:
+    """Tiny byte-level vocab with merges for 'he', 'hel', 'hell', 'hello'."""
+    vocab = {ch: i for i, ch in enumerate(BYTE_ENCODER.values())}
+    merges = [("h", "e"), ("he", "l"), ("hel", "l"), ("hell", "o")]
+    for left, right in merges:
+        vocab[left + right] = len(vocab)
+    (tmp / "vocab.json").write_text(json.dumps(vocab), encoding="utf-8")
+    (tmp / "merges.txt").write_text(
+        "#version: 0.2\n" + "".join(f"{l} {r}\n" for l, r in merges), encoding="utf-8"
+    )
+    return f"tiny={tmp / 'vocab.json'},{tmp / 'merges.txt'}"
+
+
+def test_bpe_encode():
+    """Test that merges apply in rank order and count() matches encode()."""
+    print("Test 1: BPE encode...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tok = build_tokenizers([_write_bpe(Path(tmp))])[0]
+        assert isinstance(tok, BPETokenizer) and tok.name == "tiny"
+
+        assert tok.encode("hello") == [tok.vocab["hello"]], "❌ 'hello' should merge fully"
+        assert len(tok.encode("help")) == 2, "❌ 'help' should be 'hel' + 'p'"
+        text = "hello hello ⊨ help " * 50
+        assert tok.count(text) == len(tok.encode(text)), "❌ count() must match encode()"
+        assert "hello" in tok.cache, "❌ Encoded pieces should be cached"
+
+    class Incomplete(Tokenizer):
+        name = "incomplete"
+
+    try:
+        Incomplete()
+        assert False, "❌ A tokenizer without encode() must fail at construction"
+    except TypeError:
+        pass
+
+    print("✅ PASSED: BPE encode\n")
+
+
+def test_corpus_run_parallel():
+    """Test corpus pairing and that the process pool matches the serial run."""
+    print("Test 2: Parallel corpus run...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        bpe = _write_bpe(tmp)
+        for i in range(6):
+            (tmp / f"s{i}.hml").write_text(f"#BANK:S{i}:v1.0\nX = {i}\n", encoding="utf-8")
+            (tmp / f"s{i}.txt").write_text("hello " * (i + 5), encoding="utf-8")
+        (tmp / "orphan.hml").write_text("#BANK:O:v1.0\n", encoding="utf-8")
+
+        pairs = load_corpus(tmp)
+        assert len(pairs) == 6, "❌ Specs without prose must be skipped"
+
+        specs = ["heuristic", bpe]
+        serial = run_corpus(pairs, specs, jobs=1)
+        parallel = run_corpus(pairs, specs, jobs=2)
+        assert serial == parallel, "❌ Process pool must give the same results"
+
+        summary = summarize(parallel)
+        assert set(summary) == {"heuristic", "tiny"}
+        s = summary["tiny"]
+        assert s["pairs"] == 6 and s["ratio_min"] <= s["ratio_median"] <= s["ratio_max"]
+
+    print("✅ PASSED: Parallel corpus run\n")
+
+
+def test_pretokenizer_is_lossless():
+    """Test that pre-tokenization covers every character of real specs (underscores included)."""
+    print("Test 3: Lossless pre-tokenization...")
+
+    assert PRETOKENIZE_RE.findall("STOCK_HQLA = OUTFLOWS_30D") == \
+        ["STOCK", "_", "HQLA", " =", " OUTFLOWS", "_", "30", "D"]
+    for spec in sorted(Path("specs").glob("*.hml")) + sorted(Path("examples").glob("*.hml")):
+        text = spec.read_text(encoding="utf-8")
+        assert "".join(PRETOKENIZE_RE.findall(text)) == text, f"❌ {spec} lost characters"
+
+    print("✅ PASSED: Lossless pre-tokenization\n")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 70)
+    print("HAMMERLANG BENCHMARK TEST SUITE")
+    print("=" * 70)
+    print()
+
+    tests = [
+        test_bpe_encode,
+        test_corpus_run_parallel,
+        test_pretokenizer_is_lossless,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("=" * 70)
+    print("TEST RESULTS")
+    print("=" * 70)
+    print(f"Passed: {passed}/{len(tests)}")
+    print(f"Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n✅ ALL TESTS PASSED")
+        return 0
+    else:
+        print(f"\n❌ {failed} TESTS FAILED")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -6,12 +6,27 @@ Tests syntax validation, checksum enforcement, and symbol rejection
 
 import sys
 import os
+import io
+import json
+import time
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from hammerlang import validate_locked, validate_syntax
+import hammerlang
+from hammerlang import (
+    MAX_SPEC_BYTES,
+    check_spec,
+    checksum_issues,
+    extract_checksum,
+    robust_checksum,
+    seal_code,
+    render_jsonl,
+    render_text,
+    validate_locked,
+    validate_syntax,
+)
 
 def test_bank_lcr_ok():
     """Test that canonical LCR spec passes validation."""
@@ -107,6 +122,145 @@ CONSTRAINT [LEVEL2B ≤ 0.15 * STOCK_HQLA
     print("✅ PASSED: Unbalanced brackets rejected\n")
 
 
+def test_jsonl_record():
+    """Test that --format jsonl emits one compact record per spec."""
+    print("Test 6: JSON-lines record...")
+
+    out = io.StringIO()
+    render_jsonl(check_spec("specs/missing.hml"), out)
+    render_jsonl(check_spec("specs/bank_lcr.hml", {}), out)
+
+    lines = out.getvalue().splitlines()
+    assert len(lines) == 2, "❌ Expected exactly one line per spec"
+    missing, bank = (json.loads(line) for line in lines)
+    assert missing["verdict"] == "FAIL" and missing["stage"] == "file"
+    assert bank["verdict"] == "FAIL" and bank["stage"] in ("checksum", "allowlist")
+    assert set(bank) == {"path", "verdict", "checksum", "stage", "issues", "audit", "duration_ms"}
+
+    print("✅ PASSED: JSON-lines record emitted\n")
+
+
+def test_validate_text_has_no_locked_banner():
+    """Test that plain validate mode does not claim to be Production Locked Mode."""
+    print("Test 8: validate text renderer...")
+
+    out = io.StringIO()
+    render_text(check_spec("specs/bank_lcr.hml"), out)
+    text = out.getvalue()
+    assert "LOCKED MODE" not in text and "Step 1" not in text, "❌ validate must not print the locked banner"
+    assert text.strip(), "❌ validate should report a result"
+
+    print("✅ PASSED: validate text renderer\n")
+
+
+def test_size_budget():
+    """Test that oversized hostile specs are rejected without being scanned."""
+    print("Test 7: Size budget...")
+
+    hostile = "#BANK:LCR:v1.1\n⊨a5e9f3a7" + " " * (MAX_SPEC_BYTES + 1) + "x\n"
+    start = time.perf_counter()
+    syntax = validate_syntax(hostile)
+    checksum = checksum_issues(hostile)
+    elapsed = time.perf_counter() - start
+
+    assert any("size budget" in issue for issue in syntax), "❌ Oversized spec should fail syntax"
+    assert any("size budget" in issue for issue in checksum), "❌ Oversized spec should fail checksum"
+    assert elapsed < 0.5, f"❌ Budget rejection took {elapsed:.3f}s"
+
+    print("✅ PASSED: Oversized spec rejected\n")
+
+
+def test_time_budget_interrupts_symbols():
+    """Test that the time budget stops NFKC symbol validation mid-spec."""
+    print("Test 9: Time budget...")
+
+    hostile = "#BANK:LCR:v1.1\n" + "ﷺ" * (MAX_SPEC_BYTES // 2) + "\n⊨a5e9f3a7\n"
+    saved = hammerlang.SPEC_TIME_BUDGET
+    hammerlang.SPEC_TIME_BUDGET = 0.0
+    try:
+        start = time.perf_counter()
+        issues = validate_syntax(hostile)
+        elapsed = time.perf_counter() - start
+    finally:
+        hammerlang.SPEC_TIME_BUDGET = saved
+
+    assert any("time budget" in issue for issue in issues), "❌ Time budget should be enforced"
+    assert elapsed < 0.5, f"❌ Budget should stop validation early (took {elapsed:.3f}s)"
+
+    print("✅ PASSED: Time budget enforced\n")
+
+
+def test_fuzz_harness_quick():
+    """Test that every validation stage stays linear on adversarial input."""
+    print("Test 10: Fuzz harness (quick)...")
+
+    import hammerlang_fuzz
+    assert hammerlang_fuzz.run_fuzz(quick=True), "❌ Superlinear stage or budget not applied"
+
+    print("✅ PASSED: Fuzz harness\n")
+
+
+def test_legacy_seal_still_validates():
+    """Test that legacy 8-hex seals keep validating next to versioned seals."""
+    print("Test 11: Legacy seal compatibility...")
+
+    body = "#BANK:LCR:v1.1\nLCR = STOCK_HQLA / OUTFLOWS_30D\n"
+    legacy = body + f"⊨{robust_checksum(body)}\n"
+    assert len(extract_checksum(legacy)) == 8, "❌ Legacy seal should stay 8 hex chars"
+    assert validate_syntax(legacy) == [] and checksum_issues(legacy) == []
+    assert seal_code(body, "legacy") == legacy
+
+    print("✅ PASSED: Legacy seal validates\n")
+
+
+def test_versioned_seals():
+    """Test full-length SHA-256 and BLAKE2b seals, tampering and allowlist lookup."""
+    print("Test 12: Versioned seals...")
+
+    body = "#BANK:LCR:v1.1\nLCR = STOCK_HQLA / OUTFLOWS_30D\n"
+    for algorithm in ("sha256", "blake2b"):
+        sealed = seal_code(body, algorithm)
+        checksum = extract_checksum(sealed)
+        assert checksum.startswith(f"{algorithm}:") and len(checksum) == len(algorithm) + 65
+        assert validate_syntax(sealed) == [] and checksum_issues(sealed) == []
+
+        tampered = sealed.replace("OUTFLOWS_30D", "OUTFLOWS_20D")
+        assert any("mismatch" in i for i in checksum_issues(tampered)), "❌ Tampering must be detected"
+
+        Path("specs/tmp_versioned.hml").write_text(sealed, encoding="utf-8")
+        try:
+            record = check_spec("specs/tmp_versioned.hml", {checksum: "versioned entry"})
+        finally:
+            Path("specs/tmp_versioned.hml").unlink()
+        assert record["verdict"] == "PASS" and record["checksum"] == checksum
+
+    unknown = body + "⊨md5:" + "0" * 64 + "\n"
+    assert any("checksum format" in i for i in validate_syntax(unknown)), "❌ Unknown tag must fail"
+
+    print("✅ PASSED: Versioned seals\n")
+
+
+def test_undecodable_spec_gets_record():
+    """Test that an undecodable spec yields a file-stage record instead of aborting the batch."""
+    print("Test 13: Undecodable spec in a batch...")
+
+    bad = Path("specs/tmp_undecodable.hml")
+    bad.write_bytes(b"#BANK:LCR:v1.1\nLCR = \xff\n")
+    out = io.StringIO()
+    try:
+        for path in (str(bad), "specs/missing.hml"):
+            render_jsonl(check_spec(path, {}), out)
+    finally:
+        bad.unlink()
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert len(records) == 2, "❌ Every spec should get exactly one record"
+    assert records[0]["stage"] == "file" and "UTF-8" in records[0]["issues"][0]
+    assert records[1]["stage"] == "file"
+
+    print("✅ PASSED: Undecodable spec reported\n")
+
+
 def run_all_tests():
     """Run all tests."""
     print("=" * 70)
@@ -120,6 +274,14 @@ def run_all_tests():
         test_unknown_symbol,
         test_missing_header,
         test_unbalanced_brackets,
+        test_jsonl_record,
+        test_size_budget,
+        test_validate_text_has_no_locked_banner,
+        test_time_budget_interrupts_symbols,
+        test_fuzz_harness_quick,
+        test_legacy_seal_still_validates,
+        test_versioned_seals,
+        test_undecodable_spec_gets_record,
     ]
     
     passed = 0
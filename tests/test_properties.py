@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Property-based test suite for HammerLang validation
+Synthesizes valid and tampered specs across ALLOWED_NAMESPACES, sizes and
+Unicode edge cases, runs them sharded across cores and fails any case that
+exceeds its time budget (algorithmic slowdowns).
+
+Environment:
+    HAMMERLANG_PROPERTY_CASES   generated specs per run (default 200)
+    HAMMERLANG_PROPERTY_SEED    generator seed (default 1337)
+    HAMMERLANG_SHARD            "i/n" to run only shard i of n (CI matrix)
+"""
+
+import os
+import sys
+import time
+import random
+import tempfile
+import concurrent.futures
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from hammerlang import (
+    ALLOWED_NAMESPACES,
+    MAX_SPEC_BYTES,
+    SEAL_ALGORITHMS,
+    check_spec,
+    checksum_issues,
+    extract_checksum,
+    seal_algorithm,
+    seal_code,
+    validate_syntax,
+)
+
+CASES = int(os.getenv("HAMMERLANG_PROPERTY_CASES", "200"))
+SEED = int(os.getenv("HAMMERLANG_PROPERTY_SEED", "1337"))
+
+# Target spec sizes (UTF-8 bytes): typical specs up to just under MAX_SPEC_BYTES.
+# Near-limit specs are weighted down to keep the default run short.
+SIZES = [64, 1024, 16 * 1024, 128 * 1024, MAX_SPEC_BYTES - 4096]
+SIZE_WEIGHTS = [4, 4, 4, 3, 1]
+
+# Per-case budget: fixed overhead + BUDGET_SLACK x the linear cost of the case,
+# with the cost per byte calibrated on this machine/worker. Validation is
+# linear; an algorithmic slowdown beyond BUDGET_SLACK x fails the case.
+BUDGET_BASE_S = 0.02
+BUDGET_SLACK = 10.0
+CALIBRATION_BYTES = 256 * 1024
+
+IDENTIFIERS = ["STOCK_HQLA", "LEVEL1", "LEVEL2A", "OUTFLOWS_30D", "LCR", "E", "S0", "K", "x"]
+OPERATORS = ["=", "+", "-", "*", "/", "<", ">", "≤", "≥"]
+# Characters that NFKC maps into the whitelist (must pass symbol validation)
+NFKC_ALLOWED = ["Ａ", "ｚ", "ﬁ", "²", "０"]
+# Characters that stay outside the whitelist after NFKC (must be rejected)
+NFKC_REJECTED = ["​", "é", "Ω", "\U0001F600", "‮", "½", ";"]
+
+
+# ---------------------------------------------------------------------
+# GENERADOR
+# ---------------------------------------------------------------------
+
+def gen_statement(rng: random.Random, unicode_edge: bool) -> str:
+    lhs = rng.choice(IDENTIFIERS)
+    rhs = " ".join(
+        f"{rng.choice(OPERATORS)} {rng.choice(IDENTIFIERS + [str(rng.randint(0, 999))])}"
+        for _ in range(rng.randint(1, 4))
+    )
+    stmt = f"{lhs} {rhs}"
+    if rng.random() < 0.3:
+        stmt = f"CONSTRAINT [{stmt}]"
+    if unicode_edge and rng.random() < 0.5:
+        stmt += " " + rng.choice(NFKC_ALLOWED)
+    return stmt
+
+
+def gen_body(rng: random.Random, header: str, target_bytes: int,
+             unicode_edge: bool, newline: str = "\n") -> str:
+    """Header + sentencias generadas hasta alcanzar ~target_bytes (UTF-8)."""
+    lines = [header]
+    size = len(header.encode("utf-8")) + len(newline)
+    while True:
+        stmt = gen_statement(rng, unicode_edge)
+        lines.append(stmt)
+        size += len(stmt.encode("utf-8")) + len(newline)
+        if size >= target_bytes:
+            return newline.join(lines) + newline
+
+
+def gen_plan(index: int) -> Dict:
+    """Parámetros deterministas de un caso (baratos: sin generar el cuerpo)."""
+    rng = random.Random(SEED * 1_000_003 + index)
+    return {
+        "index": index,
+        "rng": rng,
+        "namespace": ALLOWED_NAMESPACES[index % len(ALLOWED_NAMESPACES)],
+        "target_bytes": rng.choices(SIZES, SIZE_WEIGHTS)[0],
+        "unicode_edge": rng.random() < 0.3,
+        "newline": "\r\n" if rng.random() < 0.1 else "\n",
+        "algorithm": rng.choice(list(SEAL_ALGORITHMS)),
+        "kind": rng.choice(["valid", "tamper_body", "tamper_seal", "no_seal",
+                            "bad_namespace", "bad_symbol", "unbalanced"]),
+    }
+
+
+def gen_case(index: int) -> Dict:
+    """Caso determinista por índice: spec válido + su mutación (kind)."""
+    case = gen_plan(index)
+    rng = case["rng"]
+    name = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ_0123456789") for _ in range(rng.randint(1, 12)))
+    header = f"#{case['namespace']}:{name}:v{rng.randint(0, 9)}.{rng.randint(0, 99)}"
+    body = gen_body(rng, header, case["target_bytes"], case["unicode_edge"], case["newline"])
+    case["valid"] = seal_code(body, case["algorithm"])
+    return case
+
+
+def mutate(case: Dict) -> str:
+    """Aplica la mutación del caso sobre el spec válido."""
+    rng, code, kind = case["rng"], case["valid"], case["kind"]
+    seal = extract_checksum(code)
+    body, _, _ = code.rpartition("⊨")
+    if kind == "tamper_body":
+        lines = body.split("\n")
+        i = rng.randrange(1, len(lines) - 1) if len(lines) > 2 else 0
+        lines[i] = lines[i] + " + 1"
+        return "\n".join(lines) + "⊨" + seal + "\n"
+    if kind == "tamper_seal":
+        digest = seal.rsplit(":", 1)[-1]
+        pos = rng.randrange(len(digest))
+        flipped = digest[:pos] + ("0" if digest[pos] != "0" else "1") + digest[pos + 1:]
+        return body + "⊨" + seal[: len(seal) - len(digest)] + flipped + "\n"
+    if kind == "no_seal":
+        return body
+    if kind == "bad_namespace":
+        return "#ZZZ" + code[code.index(":"):]
+    if kind == "bad_symbol":
+        pos = rng.randrange(code.index("\n") + 1, len(body))
+        return code[:pos] + rng.choice(NFKC_REJECTED) + code[pos:]
+    if kind == "unbalanced":
+        return code.replace("\n", "\n[", 1)
+    return code
+
+
+# ---------------------------------------------------------------------
+# PROPIEDADES
+# ---------------------------------------------------------------------
+
+_SECONDS_PER_BYTE: Optional[float] = None
+
+
+def seconds_per_byte() -> float:
+    """
+    Costo lineal de referencia (syntax + checksum) por byte, calibrado una vez
+    por proceso con un spec con Unicode (camino NFKC, el más caro). Mejor de 3.
+    """
+    global _SECONDS_PER_BYTE
+    if _SECONDS_PER_BYTE is None:
+        rng = random.Random(SEED)
+        code = seal_code(gen_body(rng, "#BANK:CALIBRATION:v1.0", CALIBRATION_BYTES, True))
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            validate_syntax(code)
+            checksum_issues(code)
+            best = min(best, time.perf_counter() - start)
+        _SECONDS_PER_BYTE = best / len(code.encode("utf-8"))
+    return _SECONDS_PER_BYTE
+
+
+def case_budget(size_bytes: int, passes: int) -> float:
+    """Presupuesto de un caso de size_bytes validado `passes` veces."""
+    return BUDGET_BASE_S + BUDGET_SLACK * passes * seconds_per_byte() * size_bytes
+
+
+def check_case(index: int, workdir: str) -> Optional[str]:
+    """Evalúa las propiedades de un caso. Devuelve None o el motivo del fallo."""
+    case = gen_case(index)
+    code = mutate(case)
+    kind = case["kind"]
+    # Los casos válidos se validan dos veces: en memoria y end-to-end con check_spec()
+    budget = case_budget(len(code.encode("utf-8")), 2 if kind == "valid" else 1)
+
+    start = time.perf_counter()
+    syntax = validate_syntax(code)
+    checksum = checksum_issues(code)
+    record = None
+    if kind == "valid":
+        # check_spec lee con newlines universales: en disco el spec se valida
+        # en su forma LF, así que se sella esa forma para el chequeo end-to-end.
+        on_disk = seal_code(code.replace("\r\n", "\n"), case["algorithm"])
+        spec = Path(workdir) / f"case_{index}.hml"
+        spec.write_text(on_disk, encoding="utf-8", newline="")
+        record = check_spec(str(spec), {extract_checksum(on_disk): "generated"})
+        spec.unlink()
+    elapsed = time.perf_counter() - start
+
+    label = f"case {index} ({kind}, {case['algorithm']}, {len(code)} chars)"
+    if elapsed > budget:
+        return f"{label}: {elapsed:.3f}s exceeds budget {budget:.3f}s"
+
+    if kind == "valid":
+        if syntax or checksum:
+            return f"{label}: valid spec rejected: {syntax + checksum}"
+        if seal_algorithm(extract_checksum(code)) != case["algorithm"]:
+            return f"{label}: seal algorithm not preserved"
+        if seal_code(code, case["algorithm"]) != code:
+            return f"{label}: sealing is not idempotent"
+        if record["verdict"] != "PASS":
+            return f"{label}: check_spec rejected an allowlisted spec: {record['issues']}"
+    elif kind in ("tamper_body", "tamper_seal"):
+        if not any("mismatch" in i for i in checksum):
+            return f"{label}: tampering not detected: {checksum}"
+    elif kind == "no_seal":
+        if not any("checksum format" in i for i in syntax):
+            return f"{label}: missing seal accepted"
+    elif kind == "bad_namespace":
+        if not any("not allowed" in i for i in syntax):
+            return f"{label}: foreign namespace accepted"
+    elif kind == "bad_symbol":
+        if not any("Unknown symbol" in i for i in syntax):
+            return f"{label}: disallowed symbol accepted"
+    elif kind == "unbalanced":
+        if not any("bracket" in i for i in syntax):
+            return f"{label}: unbalanced brackets accepted"
+    return None
+
+
+def run_shard(shard: int, shards: int, cases: int = CASES) -> List[str]:
+    """Corre los casos index % shards == shard; devuelve los fallos."""
+    failures = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for index in range(shard, cases, shards):
+            failure = check_case(index, workdir)
+            if failure:
+                failures.append(failure)
+    return failures
+
+
+def parse_shard(value: Optional[str]) -> Optional[Tuple[int, int]]:
+    """'i/n' -> (i, n); None si no hay sharding externo."""
+    if not value:
+        return None
+    i, n = (int(x) for x in value.split("/"))
+    if not 0 <= i < n:
+        raise ValueError(f"Invalid HAMMERLANG_SHARD {value!r}")
+    return i, n
+
+
+def run_sharded(cases: int = CASES, jobs: Optional[int] = None) -> List[str]:
+    """
+    Corre los casos generados repartidos en un pool de procesos.
+    Con HAMMERLANG_SHARD=i/n solo se corre el shard i (p.ej. en una matriz de CI).
+    """
+    external = parse_shard(os.getenv("HAMMERLANG_SHARD"))
+    if external:
+        return run_shard(external[0], external[1], cases)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1:
+        return run_shard(0, 1, cases)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(run_shard, shard, jobs, cases) for shard in range(jobs)]
+        return [f for future in futures for f in future.result()]
+
+
+# ---------------------------------------------------------------------
+# TESTS
+# ---------------------------------------------------------------------
+
+def test_generator_is_deterministic():
+    """Test that the same seed and index generate the same spec."""
+    print("Test 1: Deterministic generator...")
+
+    assert mutate(gen_case(7)) == mutate(gen_case(7)), "❌ Generator must be reproducible"
+    plans = [gen_plan(i) for i in range(max(CASES, 200))]
+    kinds = {p["kind"] for p in plans}
+    sizes = {p["target_bytes"] for p in plans}
+    assert len(kinds) == 7, f"❌ All mutation kinds should be generated, got {kinds}"
+    assert sizes == set(SIZES), f"❌ Every size should be generated, got {sorted(sizes)}"
+    namespaces = {gen_case(i)["valid"][1:].split(":")[0] for i in range(len(ALLOWED_NAMESPACES))}
+    assert namespaces == set(ALLOWED_NAMESPACES), "❌ Every namespace should be covered"
+
+    print("✅ PASSED: Deterministic generator\n")
+
+
+def test_generated_specs():
+    """Test every generated valid/tampered spec, sharded, within time budgets."""
+    print(f"Test 2: {CASES} generated specs (seed {SEED})...")
+
+    failures = run_sharded()
+    assert not failures, "❌ " + "\n".join(failures[:10])
+
+    print("✅ PASSED: Generated specs\n")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 70)
+    print("HAMMERLANG PROPERTY TEST SUITE")
+    print("=" * 70)
+    print()
+
+    tests = [
+        test_generator_is_deterministic,
+        test_generated_specs,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("=" * 70)
+    print("TEST RESULTS")
+    print("=" * 70)
+    print(f"Passed: {passed}/{len(tests)}")
+    print(f"Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n✅ ALL TESTS PASSED")
+        return 0
+    else:
+        print(f"\n❌ {failed} TESTS FAILED")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
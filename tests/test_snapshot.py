@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Test suite for HammerLang shared spec snapshots
+Tests publishing, zero-copy attach, generation swap and cross-process readers
+"""
+
+import sys
+import tempfile
+import multiprocessing
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from hammerlang import checksum_issues, extract_checksum, seal_code
+from hammerlang_snapshot import SnapshotReader, publish_snapshot, read_generation
+
+AUDIT = {"spec": "BANK:SNAP:v1.0", "signed_by": "QA", "timestamp": "2026-01-01T00:00:00Z"}
+
+
+def _sealed_spec(tmp: Path, value: int) -> tuple:
+    code = seal_code(f"#BANK:SNAP:v1.0\nX = {value}\n")
+    spec = tmp / "snap.hml"
+    spec.write_text(code, encoding="utf-8")
+    return str(spec), {extract_checksum(code): AUDIT}
+
+
+def _child_checksum(path: str, queue) -> None:
+    snap = SnapshotReader(path).get()
+    queue.put((snap.generation, snap.checksum, bytes(snap.spec)))
+
+
+def test_publish_and_attach():
+    """Test that a published snapshot is attached zero-copy with its metadata."""
+    print("Test 1: Publish + attach...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        spec, allowed = _sealed_spec(tmp, 1)
+        path = tmp / "core.snap"
+
+        record = publish_snapshot(spec, path, allowed)
+        assert record["generation"] == 1, "❌ First publish should be generation 1"
+
+        snap = SnapshotReader(path).get()
+        assert isinstance(snap.spec, memoryview), "❌ Spec should be a zero-copy view"
+        assert bytes(snap.spec) == Path(spec).read_bytes()
+        assert snap.checksum == record["checksum"] and snap.audit["signed_by"] == "QA"
+        assert snap.compiled()["header"]["namespace"] == "BANK"
+        assert snap.compiled()["statements"] == ["X = 1"]
+
+    print("✅ PASSED: Publish + attach\n")
+
+
+def test_generation_swap():
+    """Test that readers swap atomically and old views stay readable."""
+    print("Test 2: Generation swap...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        path = tmp / "core.snap"
+        spec, allowed = _sealed_spec(tmp, 1)
+        publish_snapshot(spec, path, allowed)
+
+        reader = SnapshotReader(path)
+        first = reader.get()
+        assert reader.get() is first, "❌ No swap without a new generation"
+        old_spec = first.spec
+
+        spec, allowed = _sealed_spec(tmp, 2)
+        assert publish_snapshot(spec, path, allowed)["generation"] == 2
+        second = reader.get()
+        assert second is not first and second.generation == 2
+        assert b"X = 1" in bytes(old_spec), "❌ Old generation must stay intact"
+        assert b"X = 2" in bytes(second.spec)
+
+    print("✅ PASSED: Generation swap\n")
+
+
+def test_failed_validation_keeps_generation():
+    """Test that a spec failing locked validation is never published."""
+    print("Test 3: Failed validation...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        path = tmp / "core.snap"
+        spec, allowed = _sealed_spec(tmp, 1)
+        publish_snapshot(spec, path, allowed)
+
+        record = publish_snapshot(spec, path, {})
+        assert record["generation"] is None and record["stage"] == "allowlist"
+        assert read_generation(path) == 1, "❌ Previous generation must stay active"
+
+    print("✅ PASSED: Failed validation\n")
+
+
+def test_cross_process_attach():
+    """Test that another process attaches the same generation."""
+    print("Test 4: Cross-process attach...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        path = tmp / "core.snap"
+        spec, allowed = _sealed_spec(tmp, 1)
+        record = publish_snapshot(spec, path, allowed)
+
+        queue = multiprocessing.Queue()
+        child = multiprocessing.Process(target=_child_checksum, args=(str(path), queue))
+        child.start()
+        generation, checksum, spec_bytes = queue.get(timeout=30)
+        child.join(timeout=30)
+
+        assert (generation, checksum) == (1, record["checksum"])
+        assert spec_bytes == Path(spec).read_bytes()
+
+    print("✅ PASSED: Cross-process attach\n")
+
+
+def test_publishes_validated_text():
+    """Test that a CRLF spec is published as the exact (LF-normalized) text that was validated."""
+    print("Test 5: Published bytes match validated text...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        code = seal_code("#BANK:SNAP:v1.0\nX = 1\n")
+        spec = tmp / "crlf.hml"
+        spec.write_bytes(code.replace("\n", "\r\n").encode("utf-8"))
+        path = tmp / "core.snap"
+
+        record = publish_snapshot(str(spec), path, {extract_checksum(code): AUDIT})
+        assert record["generation"] == 1, f"❌ CRLF spec should publish: {record['issues']}"
+
+        snap = SnapshotReader(path).get()
+        assert snap.spec_text() == code, "❌ Snapshot must hold the validated text"
+        assert checksum_issues(snap.spec_text()) == [], "❌ Published spec must self-validate"
+
+    print("✅ PASSED: Published bytes match validated text\n")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 70)
+    print("HAMMERLANG SNAPSHOT TEST SUITE")
+    print("=" * 70)
+    print()
+
+    tests = [
+        test_publish_and_attach,
+        test_generation_swap,
+        test_failed_validation_keeps_generation,
+        test_cross_process_attach,
+        test_publishes_validated_text,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("=" * 70)
+    print("TEST RESULTS")
+    print("=" * 70)
+    print(f"Passed: {passed}/{len(tests)}")
+    print(f"Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n✅ ALL TESTS PASSED")
+        return 0
+    else:
+        print(f"\n❌ {failed} TESTS FAILED")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())